@@ -1,117 +1,162 @@
 from __future__ import annotations
 
 import argparse
-import csv
 import glob
 import math
 import os
-from dataclasses import dataclass
-from typing import Dict, List, Tuple
-
-
-@dataclass(frozen=True)
-class Row:
-    scheme: str
-    bits: int
-    lam: int
-    op: str
-    warmup: int
-    rep: int
-    elapsed_ns: int
-    icert_len_bytes: int
-    pk_len_bytes: int
-    sk_len_bytes: int
-
-
-def _read_rows(paths: List[str]) -> List[Row]:
-    rows: List[Row] = []
-    for p in paths:
-        with open(p, "r", newline="") as f:
-            r = csv.DictReader(f)
-            required = {
-                "scheme",
-                "bits",
-                "lam",
-                "op",
-                "warmup",
-                "rep",
-                "elapsed_ns",
-                "icert_len_bytes",
-                "pk_len_bytes",
-                "sk_len_bytes",
-            }
-            if not required.issubset(set(r.fieldnames or [])):
-                missing = required - set(r.fieldnames or [])
-                raise ValueError(f"{p}: missing columns {sorted(missing)}")
-
-            for d in r:
-                rows.append(
-                    Row(
-                        scheme=str(d["scheme"]),
-                        bits=int(d["bits"]),
-                        lam=int(d["lam"]),
-                        op=str(d["op"]),
-                        warmup=int(d["warmup"]),
-                        rep=int(d["rep"]),
-                        elapsed_ns=int(d["elapsed_ns"]),
-                        icert_len_bytes=int(d["icert_len_bytes"]),
-                        pk_len_bytes=int(d["pk_len_bytes"]),
-                        sk_len_bytes=int(d["sk_len_bytes"]),
-                    )
-                )
-    return rows
-
-
-def _percentile(sorted_vals: List[int], q: float) -> int:
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from p2quantile import P2Quantile
+
+# Raw benchmark CSV columns and their parsed dtypes.
+DTYPES = {
+    "scheme": "category",
+    "bits": "int32",
+    "lam": "int32",
+    "op": "category",
+    "warmup": "int8",
+    "rep": "int32",
+    "elapsed_ns": "int64",
+    "icert_len_bytes": "int64",
+    "pk_len_bytes": "int64",
+    "sk_len_bytes": "int64",
+}
+
+GROUP_KEYS = ["scheme", "bits", "lam", "op"]
+LENGTH_COLUMNS = ["icert_len_bytes", "pk_len_bytes", "sk_len_bytes"]
+
+# Sidecar suffix for parsed-CSV caches (see _load_one).
+CACHE_SUFFIX = ".cache.pkl"
+
+SUMMARY_COLUMNS = GROUP_KEYS + [
+    "n",
+    "mean_ns",
+    "median_ns",
+    "p95_ns",
+    "p99_ns",
+    "min_ns",
+    "max_ns",
+] + LENGTH_COLUMNS
+
+
+def _parse_one(path: str) -> pd.DataFrame:
+    df = pd.read_csv(path, usecols=lambda c: c in DTYPES, dtype=DTYPES, engine="c")
+    missing = set(DTYPES) - set(df.columns)
+    if missing:
+        raise ValueError(f"{path}: missing columns {sorted(missing)}")
+    return df
+
+
+def _load_one(path: str, use_cache: bool = True) -> pd.DataFrame:
     """
-    Nearest-rank percentile (q in [0,1]).
+    Parse one raw CSV, reusing a sidecar cache when the file is unchanged.
+    The cache (path + CACHE_SUFFIX) stores the parsed frame together with the
+    (st_size, st_mtime_ns) of the CSV it was built from; any mismatch re-parses.
+    """
+    if not use_cache:
+        return _parse_one(path)
+
+    st = os.stat(path)
+    key = (st.st_size, st.st_mtime_ns)
+    cache_path = path + CACHE_SUFFIX
+    try:
+        with open(cache_path, "rb") as f:
+            cached_key, df = pickle.load(f)
+        if cached_key == key:
+            return df
+    except Exception:
+        # Missing, truncated or written by another pandas/numpy version
+        # (AttributeError, ModuleNotFoundError, TypeError, ...): re-parse.
+        pass
+
+    df = _parse_one(path)
+    try:
+        with open(cache_path, "wb") as f:
+            pickle.dump((key, df), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # read-only outputs directory: caching is best-effort
+    return df
+
+
+def _read_rows(paths: List[str], use_cache: bool = True, jobs: Optional[int] = None) -> pd.DataFrame:
+    """
+    Load and concatenate all inputs. Files are independent, so with more than
+    one input they are parsed in a process pool (ex.map keeps input order).
+    """
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    jobs = max(1, min(jobs, len(paths)))
+    load = partial(_load_one, use_cache=use_cache)
+    if jobs == 1:
+        frames = [load(p) for p in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as ex:
+            frames = list(ex.map(load, paths, chunksize=4))
+    return pd.concat(frames, ignore_index=True)
+
+
+def _nearest_rank(n: int, q: float) -> int:
+    """
+    Zero-based index of the nearest-rank percentile (q in [0,1]) among n values.
     For paper tables this is stable, simple, and reviewer-friendly.
     """
-    if not sorted_vals:
+    if n == 0:
         raise ValueError("empty values")
     if q <= 0:
-        return sorted_vals[0]
+        return 0
     if q >= 1:
-        return sorted_vals[-1]
-    k = math.ceil(q * len(sorted_vals)) - 1
-    k = max(0, min(k, len(sorted_vals) - 1))
-    return sorted_vals[k]
-
-
-def _summarize(vals: List[int]) -> Dict[str, int]:
-    vals_sorted = sorted(vals)
-    n = len(vals_sorted)
-    mean = int(round(sum(vals_sorted) / n))
-    median = (
-        vals_sorted[n // 2]
-        if (n % 2 == 1)
-        else int(round((vals_sorted[n // 2 - 1] + vals_sorted[n // 2]) / 2))
+        return n - 1
+    k = math.ceil(q * n) - 1
+    return max(0, min(k, n - 1))
+
+
+def _order_stats(vals: pd.Series) -> pd.Series:
+    """
+    Median, p95 and p99 from a single partial sort.
+    All ranks are known up front, so one np.partition (O(n)) places every
+    requested order statistic instead of a full sort or one pass per rank.
+    """
+    a = vals.to_numpy()
+    n = a.size
+    k_med_lo = (n - 1) // 2
+    k_med_hi = n // 2
+    k95 = _nearest_rank(n, 0.95)
+    k99 = _nearest_rank(n, 0.99)
+    part = np.partition(a, sorted({k_med_lo, k_med_hi, k95, k99}))
+    median = int(round((int(part[k_med_lo]) + int(part[k_med_hi])) / 2))
+    return pd.Series(
+        {"median_ns": median, "p95_ns": int(part[k95]), "p99_ns": int(part[k99])}
     )
-    p95 = _percentile(vals_sorted, 0.95)
-    p99 = _percentile(vals_sorted, 0.99)
-    vmin = vals_sorted[0]
-    vmax = vals_sorted[-1]
-    return {
-        "n": n,
-        "mean_ns": mean,
-        "median_ns": median,
-        "p95_ns": p95,
-        "p99_ns": p99,
-        "min_ns": vmin,
-        "max_ns": vmax,
-    }
-
-
-def _stable_len(vals: List[int]) -> int:
+
+
+def _order_stats_p2(vals: pd.Series) -> pd.Series:
+    """
+    Streaming (P^2) estimates of median, p95 and p99, fed in input order.
+    Approximate; use only for incremental aggregation over very large sweeps.
+    """
+    est = {"median_ns": P2Quantile(0.5), "p95_ns": P2Quantile(0.95), "p99_ns": P2Quantile(0.99)}
+    for v in vals.to_numpy().tolist():
+        for e in est.values():
+            e.update(v)
+    return pd.Series({k: int(round(e.value())) for k, e in est.items()})
+
+
+def _stable_lengths(rows: pd.DataFrame) -> pd.DataFrame:
     """
-    Choose a stable representative length from observed values.
+    Choose a stable representative length per group, for every length column.
     - If there are non-zero values (typical for iCert-related ops), use min(nonzero).
     - Else (e.g., Setup rows where iCert_len=0), return 0.
+    Zeros are masked to NaN so a single groupby min (NaN-skipping) does the work.
     """
-    nonzero = [v for v in vals if v > 0]
-    if nonzero:
-        return min(nonzero)
-    return 0
+    masked = rows.assign(**{c: rows[c].where(rows[c] > 0) for c in LENGTH_COLUMNS})
+    stable = masked.groupby(GROUP_KEYS, observed=True, sort=True)[LENGTH_COLUMNS].min()
+    return stable.fillna(0).astype("int64")
 
 
 def main() -> None:
@@ -140,74 +185,53 @@ def main() -> None:
         action="store_true",
         help="Include warmup rows (default: excluded).",
     )
+    ap.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Always re-parse inputs; do not read or write {CACHE_SUFFIX} sidecars.",
+    )
+    ap.add_argument(
+        "--p2",
+        action="store_true",
+        help="Estimate median/p95/p99 with the streaming P^2 algorithm instead of exact nearest-rank.",
+    )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for parsing inputs (default: CPU count; 1 = serial).",
+    )
     args = ap.parse_args()
 
     paths = args.inputs if args.inputs else sorted(glob.glob(args.globpat))
     if not paths:
         raise SystemExit(f"No input CSVs found (inputs={args.inputs}, glob={args.globpat}).")
 
-    rows = _read_rows(paths)
+    rows = _read_rows(paths, use_cache=not args.no_cache, jobs=args.jobs)
     if not args.include_warmup:
-        rows = [x for x in rows if x.warmup == 0]
+        rows = rows[rows["warmup"] == 0]
+
+    order_stats = _order_stats_p2 if args.p2 else _order_stats
 
     # Group by (scheme, bits, lam, op)
-    groups: Dict[Tuple[str, int, int, str], List[Row]] = {}
-    for x in rows:
-        key = (x.scheme, x.bits, x.lam, x.op)
-        groups.setdefault(key, []).append(x)
+    groups = rows.groupby(GROUP_KEYS, observed=True, sort=True)
+    summary = groups.agg(
+        n=("elapsed_ns", "size"),
+        mean_ns=("elapsed_ns", "mean"),
+        min_ns=("elapsed_ns", "min"),
+        max_ns=("elapsed_ns", "max"),
+    )
+    summary["mean_ns"] = summary["mean_ns"].round().astype("int64")
+    summary = summary.join(groups["elapsed_ns"].apply(order_stats).unstack().astype("int64"))
+    summary = summary.join(_stable_lengths(rows))
 
     os.makedirs(os.path.dirname(args.out), exist_ok=True)
-    with open(args.out, "w", newline="") as f:
-        w = csv.DictWriter(
-            f,
-            fieldnames=[
-                "scheme",
-                "bits",
-                "lam",
-                "op",
-                "n",
-                "mean_ns",
-                "median_ns",
-                "p95_ns",
-                "p99_ns",
-                "min_ns",
-                "max_ns",
-                "icert_len_bytes",
-                "pk_len_bytes",
-                "sk_len_bytes",
-            ],
-        )
-        w.writeheader()
-
-        for (scheme, bits, lam, op), rs in sorted(groups.items()):
-            vals = [r.elapsed_ns for r in rs]
-            stats = _summarize(vals)
-
-            icert_len = _stable_len([r.icert_len_bytes for r in rs])
-            pk_len = _stable_len([r.pk_len_bytes for r in rs])
-            sk_len = _stable_len([r.sk_len_bytes for r in rs])
-
-            w.writerow(
-                {
-                    "scheme": scheme,
-                    "bits": bits,
-                    "lam": lam,
-                    "op": op,
-                    "n": stats["n"],
-                    "mean_ns": stats["mean_ns"],
-                    "median_ns": stats["median_ns"],
-                    "p95_ns": stats["p95_ns"],
-                    "p99_ns": stats["p99_ns"],
-                    "min_ns": stats["min_ns"],
-                    "max_ns": stats["max_ns"],
-                    "icert_len_bytes": icert_len,
-                    "pk_len_bytes": pk_len,
-                    "sk_len_bytes": sk_len,
-                }
-            )
+    summary.reset_index().to_csv(
+        args.out, index=False, columns=SUMMARY_COLUMNS, lineterminator="\r\n"
+    )
 
     print(f"Wrote: {args.out}")
-    print(f"Inputs: {len(paths)} file(s); rows used: {len(rows)}; groups: {len(groups)}")
+    print(f"Inputs: {len(paths)} file(s); rows used: {len(rows)}; groups: {len(summary)}")
 
 
 if __name__ == "__main__":
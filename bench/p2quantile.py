@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import math
+from typing import List
+
+
+class P2Quantile:
+    """
+    Streaming quantile estimate with O(1) state (Jain & Chlamtac, 1985, "P^2").
+
+    Five markers track min, q/2, q, (1+q)/2 and max; each update moves the
+    inner markers towards their desired positions with a piecewise-parabolic
+    (or, if that would break monotonicity, linear) height adjustment.
+    Until five observations have been seen the exact nearest-rank value is
+    returned, matching aggregate.py.
+    """
+
+    __slots__ = ("q", "count", "_init", "_heights", "_pos", "_desired", "_incr")
+
+    def __init__(self, q: float) -> None:
+        if not 0 < q < 1:
+            raise ValueError(f"quantile must be in (0, 1), got {q}")
+        self.q = q
+        self.count = 0
+        self._init: List[float] = []
+        self._heights: List[float] = []
+        self._pos: List[int] = [1, 2, 3, 4, 5]
+        self._desired: List[float] = [1.0, 1 + 2 * q, 1 + 4 * q, 3 + 2 * q, 5.0]
+        self._incr: List[float] = [0.0, q / 2, q, (1 + q) / 2, 1.0]
+
+    def update(self, x: float) -> None:
+        self.count += 1
+        if self.count <= 5:
+            self._init.append(x)
+            if self.count == 5:
+                self._heights = sorted(self._init)
+            return
+
+        h = self._heights
+        pos = self._pos
+
+        # Locate the cell containing x, extending the extremes if needed.
+        if x < h[0]:
+            h[0] = x
+            k = 0
+        elif x >= h[4]:
+            h[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= h[k + 1]:
+                k += 1
+
+        for i in range(k + 1, 5):
+            pos[i] += 1
+        for i in range(5):
+            self._desired[i] += self._incr[i]
+
+        # Adjust the three inner markers.
+        for i in range(1, 4):
+            d = self._desired[i] - pos[i]
+            if (d >= 1 and pos[i + 1] - pos[i] > 1) or (d <= -1 and pos[i - 1] - pos[i] < -1):
+                s = 1 if d > 0 else -1
+                cand = self._parabolic(i, s)
+                if not h[i - 1] < cand < h[i + 1]:
+                    cand = h[i] + s * (h[i + s] - h[i]) / (pos[i + s] - pos[i])
+                h[i] = cand
+                pos[i] += s
+
+    def _parabolic(self, i: int, s: int) -> float:
+        h = self._heights
+        pos = self._pos
+        return h[i] + s / (pos[i + 1] - pos[i - 1]) * (
+            (pos[i] - pos[i - 1] + s) * (h[i + 1] - h[i]) / (pos[i + 1] - pos[i])
+            + (pos[i + 1] - pos[i] - s) * (h[i] - h[i - 1]) / (pos[i] - pos[i - 1])
+        )
+
+    def value(self) -> float:
+        if self.count == 0:
+            raise ValueError("empty values")
+        if self.count <= 5:
+            vals = sorted(self._init)
+            k = max(0, min(math.ceil(self.q * len(vals)) - 1, len(vals) - 1))
+            return vals[k]
+        return self._heights[2]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import argparse
 import os
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -17,6 +18,10 @@ plt.rcParams.update({
 
 SUMMARY_PATH = "bench/outputs/summary_all_sec128_v2.csv"
 OUT_DIR = "bench/figures"
+FORMATS = ("pdf", "png")
+
+# Bar outline style, passed straight to the bar call instead of per patch.
+BAR_STYLE = {"edgecolor": "black", "linewidth": 0.8}
 
 # ---- NEW: hatch/line style maps (BW-friendly) ----
 HATCHES = {
@@ -31,8 +36,8 @@ LINESTYLES = {
 }
 
 
-def ns_to_ms(ns: float) -> float:
-    return ns / 1e6
+NS_PER_MS = 1e6
+BYTES_PER_MB = 1024.0 * 1024.0
 
 
 def _load_summary():
@@ -43,18 +48,25 @@ def _load_summary():
 
     df["op"] = pd.Categorical(df["op"], categories=op_order, ordered=True)
     df["scheme"] = pd.Categorical(df["scheme"], categories=scheme_order, ordered=True)
-    df = df.sort_values(["op", "scheme"])
+    # Categories fix the plotting order; drop the ones absent from this summary
+    # so pivots don't materialize empty rows/columns for them.
+    for col in ("op", "scheme"):
+        df[col] = df[col].cat.remove_unused_categories()
+    df = df.sort_values(["op", "scheme"]).reset_index(drop=True)
     return df
 
 
-def _save(fig, stem: str):
+def _save(fig, stem: str, formats: tuple[str, ...] = FORMATS):
+    # Each savefig renders the figure again; the 300-dpi PNG raster is the
+    # expensive one, so only the requested formats are produced.
     os.makedirs(OUT_DIR, exist_ok=True)
-    pdf_path = os.path.join(OUT_DIR, f"{stem}.pdf")
-    png_path = os.path.join(OUT_DIR, f"{stem}.png")
-    fig.savefig(pdf_path)
-    fig.savefig(png_path, dpi=300)
+    paths = []
+    for fmt in formats:
+        path = os.path.join(OUT_DIR, f"{stem}.{fmt}")
+        fig.savefig(path, dpi=300 if fmt == "png" else "figure")
+        paths.append(path)
     plt.close(fig)
-    print(f"[{stem}] Saved to {pdf_path} and {png_path}")
+    print(f"[{stem}] Saved to {' and '.join(paths)}")
 
 
 # ---- NEW: helper to apply hatches + BW-friendly legend ----
@@ -79,8 +91,6 @@ def _apply_hatches_and_bw_legend(
 
         for p in cont.patches:
             p.set_hatch(hatch)
-            p.set_edgecolor("black")
-            p.set_linewidth(0.8)
 
         handles.append(
             Patch(
@@ -95,13 +105,12 @@ def _apply_hatches_and_bw_legend(
 
 
 
-def plot_fig1_cost_breakdown():
-    df = _load_summary()
-    df["mean_ms"] = df["mean_ns"].apply(ns_to_ms)
-    pivot = df.pivot(index="op", columns="scheme", values="mean_ms")
+def plot_fig1_cost_breakdown(df: pd.DataFrame, formats: tuple[str, ...] = FORMATS):
+    d = df[["op", "scheme"]].assign(mean_ms=df["mean_ns"] / NS_PER_MS)
+    pivot = d.pivot(index="op", columns="scheme", values="mean_ms")
 
     fig, ax = plt.subplots(figsize=(6.5, 3.8))
-    pivot.plot(kind="bar", ax=ax, width=0.75)
+    pivot.plot(kind="bar", ax=ax, width=0.75, **BAR_STYLE)
 
     ax.set_ylabel("Latency (ms)")
     ax.set_xlabel("")
@@ -118,17 +127,16 @@ def plot_fig1_cost_breakdown():
     )
 
     fig.tight_layout()
-    _save(fig, "fig1_cost_breakdown")
+    _save(fig, "fig1_cost_breakdown", formats)
 
 
 
-def plot_fig2_tail_latency_p95():
-    df = _load_summary()
-    df["p95_ms"] = df["p95_ns"].apply(ns_to_ms)
-    pivot = df.pivot(index="op", columns="scheme", values="p95_ms")
+def plot_fig2_tail_latency_p95(df: pd.DataFrame, formats: tuple[str, ...] = FORMATS):
+    d = df[["op", "scheme"]].assign(p95_ms=df["p95_ns"] / NS_PER_MS)
+    pivot = d.pivot(index="op", columns="scheme", values="p95_ms")
 
     fig, ax = plt.subplots(figsize=(6.5, 3.8))
-    pivot.plot(kind="bar", ax=ax, width=0.75)
+    pivot.plot(kind="bar", ax=ax, width=0.75, **BAR_STYLE)
 
     ax.set_ylabel("Latency (ms)")
     ax.set_xlabel("")
@@ -139,16 +147,14 @@ def plot_fig2_tail_latency_p95():
     _apply_hatches_and_bw_legend(ax, [str(c) for c in pivot.columns], legend_title="Scheme")
 
     fig.tight_layout()
-    _save(fig, "fig2_tail_latency_p95")
+    _save(fig, "fig2_tail_latency_p95", formats)
 
 
-def plot_fig3_size_footprint():
+def plot_fig3_size_footprint(df: pd.DataFrame, formats: tuple[str, ...] = FORMATS):
     """
     Fig.3: Size footprint (bytes) of iCer / pk / sk for each instantiation.
     Sizes are constant across ops in the summary; we use iCertGen rows.
     """
-    df = _load_summary()
-
     sub = df[df["op"] == "iCertGen"][["scheme", "icert_len_bytes", "pk_len_bytes", "sk_len_bytes"]].copy()
     sub = sub.sort_values("scheme")
 
@@ -158,7 +164,7 @@ def plot_fig3_size_footprint():
     pivot = sub.set_index("scheme")[metrics]
 
     fig, ax = plt.subplots(figsize=(6.8, 3.6))
-    pivot.rename(columns=dict(zip(metrics, labels))).plot(kind="barh", ax=ax)
+    pivot.rename(columns=dict(zip(metrics, labels))).plot(kind="barh", ax=ax, **BAR_STYLE)
 
     ax.set_xlabel("Size (bytes)")
     ax.set_ylabel("")
@@ -182,8 +188,6 @@ def plot_fig3_size_footprint():
 
         for p in cont.patches:
             p.set_hatch(hatch)
-            p.set_edgecolor("black")
-            p.set_linewidth(0.8)
 
         handles.append(
             Patch(
@@ -198,10 +202,10 @@ def plot_fig3_size_footprint():
 
 
     fig.tight_layout()
-    _save(fig, "fig3_size_footprint")
+    _save(fig, "fig3_size_footprint", formats)
 
 
-def plot_fig4_scale_out_model():
+def plot_fig4_scale_out_model(df: pd.DataFrame, formats: tuple[str, ...] = FORMATS):
     """
     Fig.4: Model-based scale-out analysis.
     Total public material size vs. number of devices.
@@ -210,24 +214,20 @@ def plot_fig4_scale_out_model():
       Per device public material = |iCer| + |pk|
       (sk is excluded since it is not distributed/stored publicly)
     """
-    df = _load_summary()
-
     sub = df[df["op"] == "iCertGen"][["scheme", "icert_len_bytes", "pk_len_bytes"]].copy()
-    sub["per_device_bytes"] = sub["icert_len_bytes"] + sub["pk_len_bytes"]
+    sub["per_device_bytes"] = (sub["icert_len_bytes"] + sub["pk_len_bytes"]).astype("int64")
     sub = sub.sort_values("scheme")
 
     devices = np.array([1e3, 1e4, 1e5, 1e6], dtype=float)
+    # schemes x device-counts in one outer product
+    total_mb = np.outer(sub["per_device_bytes"].to_numpy(dtype=float), devices) / BYTES_PER_MB
 
     fig, ax = plt.subplots(figsize=(6.5, 3.8))
-    for _, row in sub.iterrows():
-        scheme = str(row["scheme"])
-        per_dev = float(row["per_device_bytes"])
-        total_mb = (devices * per_dev) / (1024.0 * 1024.0)
-
+    for scheme, totals in zip(sub["scheme"].astype(str), total_mb):
         ls, mk = LINESTYLES.get(scheme, ("-", "o"))
         ax.plot(
             devices,
-            total_mb,
+            totals,
             linestyle=ls,
             marker=mk,
             markerfacecolor="none",   # BW-friendly
@@ -243,14 +243,24 @@ def plot_fig4_scale_out_model():
 
     ax.grid(True, which="both", linestyle="--", linewidth=0.5, alpha=0.7)
     fig.tight_layout()
-    _save(fig, "fig4_scale_out_model")
+    _save(fig, "fig4_scale_out_model", formats)
 
 
 def main():
-    plot_fig1_cost_breakdown()
-    plot_fig2_tail_latency_p95()
-    plot_fig3_size_footprint()
-    plot_fig4_scale_out_model()
+    ap = argparse.ArgumentParser(description="Generate paper figures from the benchmark summary.")
+    ap.add_argument(
+        "--formats",
+        default=",".join(FORMATS),
+        help="Comma-separated output formats (default: pdf,png). Use 'pdf' to skip PNG rasterization.",
+    )
+    args = ap.parse_args()
+    formats = tuple(f.strip() for f in args.formats.split(",") if f.strip())
+
+    df = _load_summary()  # parsed once, shared read-only by every figure
+    plot_fig1_cost_breakdown(df, formats)
+    plot_fig2_tail_latency_p95(df, formats)
+    plot_fig3_size_footprint(df, formats)
+    plot_fig4_scale_out_model(df, formats)
 
 
 if __name__ == "__main__":
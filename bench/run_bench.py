@@ -2,19 +2,40 @@ from __future__ import annotations
 
 import argparse
 import csv
+import gc
+import multiprocessing as mp
 import os
-import time
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Callable
+from time import perf_counter_ns as _pcn
+from typing import Callable, TypeVar
 
 from gic.core import PKRecon, SKGen, Setup, iCertGen
 
-from instantiations.gq import gen_rsa_modulus, make_gq_params
+from instantiations.gq import gen_rsa_primes, make_gq_params
 from instantiations.schnorr import make_schnorr_params
 from instantiations.bls import make_bls_params
 
+from p2quantile import P2Quantile
 
-@dataclass(frozen=True)
+T = TypeVar("T")
+
+RAW_COLUMNS = (
+    "scheme",
+    "bits",
+    "lam",
+    "op",
+    "warmup",
+    "rep",
+    "elapsed_ns",
+    "icert_len_bytes",
+    "pk_len_bytes",
+    "sk_len_bytes",
+)
+
+
+@dataclass(frozen=True, slots=True)
 class BenchConfig:
     scheme: str
     bits: int
@@ -24,12 +45,134 @@ class BenchConfig:
     reps: int
     out: str
     identity: bytes
+    summary_only: bool = False
+    check: str = "first"
+    presample: bool = False
+    fresh_ca: bool = False
+    trust_encoding: bool = False
+    fuse_keygen: bool = False
+    jobs: int = 1
+    bls_backend: str = "pyecc"
+    crt: bool = False
+
+
+SUMMARY_COLUMNS = (
+    "scheme",
+    "bits",
+    "lam",
+    "op",
+    "n",
+    "mean_ns",
+    "median_ns",
+    "p95_ns",
+    "p99_ns",
+    "min_ns",
+    "max_ns",
+    "icert_len_bytes",
+    "pk_len_bytes",
+    "sk_len_bytes",
+)
+
+
+class _OpSummary:
+    """
+    Running summary of one op over measured (non-warmup) reps, in the column
+    layout of aggregate.py. Percentiles are streaming P^2 estimates, so no
+    raw rows need to be kept.
+    """
+
+    __slots__ = ("n", "total_ns", "min_ns", "max_ns", "icert_len", "quantiles")
+
+    def __init__(self) -> None:
+        self.n = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+        self.icert_len = 0
+        self.quantiles = {
+            "median_ns": P2Quantile(0.5),
+            "p95_ns": P2Quantile(0.95),
+            "p99_ns": P2Quantile(0.99),
+        }
+
+    def update(self, elapsed_ns: int, icert_len: int) -> None:
+        if self.n == 0:
+            self.min_ns = self.max_ns = elapsed_ns
+        else:
+            self.min_ns = min(self.min_ns, elapsed_ns)
+            self.max_ns = max(self.max_ns, elapsed_ns)
+        self.n += 1
+        self.total_ns += elapsed_ns
+        if icert_len > 0 and (self.icert_len == 0 or icert_len < self.icert_len):
+            self.icert_len = icert_len
+        for est in self.quantiles.values():
+            est.update(elapsed_ns)
+
+    def stats(self) -> tuple:
+        return (
+            self.n,
+            int(round(self.total_ns / self.n)),
+            *(int(round(est.value())) for est in self.quantiles.values()),
+            self.min_ns,
+            self.max_ns,
+            self.icert_len,
+        )
+
+
+# sample_H draws: iCertGen (k_U, k_C) per rep, Setup (sk_C) once or per rep
+_H_SAMPLES_ICERT = 2
+_H_SAMPLES_SETUP = 1
+
+
+class _PresampledH:
+    """
+    sample_H backed by a pool that is topped up between reps, so CSPRNG draws
+    (and GQ's gcd rejection loop) run outside the timed region. Falls back to
+    the underlying sampler if the pool runs dry.
+    """
+
+    __slots__ = ("_sample", "_pool")
+
+    def __init__(self, sample: Callable[[], object]) -> None:
+        self._sample = sample
+        self._pool: list = []
 
+    def refill(self, n: int) -> None:
+        pool = self._pool
+        while len(pool) < n:
+            pool.append(self._sample())
 
-def _timed_ns(fn: Callable[[], object]) -> int:
-    t0 = time.perf_counter_ns()
-    fn()
-    return time.perf_counter_ns() - t0
+    def __call__(self):
+        pool = self._pool
+        return pool.pop() if pool else self._sample()
+
+
+def _timed_ns(fn: Callable[..., T], *args: object) -> tuple[int, T]:
+    """
+    Time a single call fn(*args); return (elapsed_ns, result).
+
+    The cyclic GC is paused for the call so a collection triggered by earlier
+    allocations does not land inside the measurement and inflate p95/p99.
+    One-off transients (imports, caches, page faults) are absorbed by warmup.
+    """
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        t0 = _pcn()
+        result = fn(*args)
+        t1 = _pcn()
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return t1 - t0, result
+
+
+def _pin_process(cpu: int) -> None:
+    """Best-effort: pin to one CPU to reduce scheduler noise."""
+    try:
+        os.sched_setaffinity(0, {cpu})
+    except (AttributeError, OSError) as e:
+        print(f"[warn] could not pin to CPU {cpu}: {e}", file=sys.stderr)
 
 
 def _apply_security_profile(scheme: str, bits: int, lam: int, sec: int | None) -> tuple[int, int]:
@@ -73,185 +216,215 @@ def _pk_sk_lengths_bytes(scheme_name: str, rsa_modulus: int | None = None) -> tu
     raise ValueError(f"Unsupported scheme_name={scheme_name}.")
 
 
-def _write_row(
-    w: csv.DictWriter,
-    scheme: str,
-    bits: int,
-    lam: int,
-    op: str,
-    warmup: int,
-    rep: int,
-    elapsed_ns: int,
-    icert_len: int,
-    pk_len: int,
-    sk_len: int,
-) -> None:
-    w.writerow(
-        {
-            "scheme": scheme,
-            "bits": bits,
-            "lam": lam,
-            "op": op,
-            "warmup": warmup,
-            "rep": rep,
-            "elapsed_ns": elapsed_ns,
-            "icert_len_bytes": icert_len,
-            "pk_len_bytes": pk_len,
-            "sk_len_bytes": sk_len,
-        }
+def _build_params(cfg: BenchConfig, factors: tuple[int, int] | None = None):
+    """
+    (params, sample_H) for cfg.scheme; GQ needs the modulus factors (p, q).
+    The factors only reach KeyGen with --crt: a user does not hold them, so by
+    default every KeyGen is the plain s^{-e} mod N of Fig.1.
+    """
+    if cfg.scheme == "gq":
+        p, q = factors
+        return make_gq_params(
+            N=p * q,
+            e_rsa=cfg.e_rsa,
+            lam=cfg.lam,
+            factors=(p, q) if cfg.crt else None,
+            unsafe_skip_validation=cfg.trust_encoding,
+        )
+    if cfg.scheme == "schnorr":
+        return make_schnorr_params(lam=cfg.lam)
+    return make_bls_params(
+        lam=cfg.lam,
+        unsafe_skip_validation=cfg.trust_encoding,
+        backend=cfg.bls_backend,
+    )
+
+
+def _run_rep(cfg: BenchConfig, params, sample_H, ca, i: int, head: tuple, lens: tuple, h_per_rep: int) -> list[tuple]:
+    """
+    Run rep i (warmups first) and return its raw rows. ca is the long-term
+    (sk_C, pk_C), or None with --fresh-ca (Setup is then timed in the rep).
+    """
+    rows: list[tuple] = []
+    append = rows.append
+    is_warmup = 1 if i < cfg.warmup else 0
+    rep = i if is_warmup else i - cfg.warmup
+    if cfg.presample:
+        sample_H.refill(h_per_rep)
+
+    if ca is None:
+        t_setup, (sk_C, pk_C) = _timed_ns(Setup, params, sample_H)
+
+        append((*head, "Setup", is_warmup, rep, t_setup, 0, *lens))  # no iCert at setup time
+    else:
+        sk_C, pk_C = ca
+
+    # ------------------------------------------------------------
+    # iCertGen
+    # ------------------------------------------------------------
+    t_icert, ((iCer, _), (_, view_U)) = _timed_ns(
+        iCertGen, params, cfg.identity, sk_C, sample_H, cfg.fuse_keygen
     )
 
+    append((*head, "iCertGen", is_warmup, rep, t_icert, len(iCer), *lens))
+
+    # ------------------------------------------------------------
+    # SKGen
+    # ------------------------------------------------------------
+    t_skgen, sk_U = _timed_ns(SKGen, params, view_U, iCer)
+
+    append((*head, "SKGen", is_warmup, rep, t_skgen, len(iCer), *lens))
+
+    # ------------------------------------------------------------
+    # PKRecon
+    # ------------------------------------------------------------
+    t_pkrecon, pk_U = _timed_ns(PKRecon, params, iCer, pk_C)
+
+    append((*head, "PKRecon", is_warmup, rep, t_pkrecon, len(iCer), *lens))
+
+    # ------------------------------------------------------------
+    # Correctness check (outside timing; --check selects which reps)
+    # ------------------------------------------------------------
+    if not is_warmup and (
+        cfg.check == "all"
+        or (cfg.check == "first" and rep == 0)
+        or (cfg.check == "last" and rep == cfg.reps - 1)
+    ):
+        assert pk_U is not None  # the measured PKRecon result; no extra decode
+        assert params.keygen(sk_U) == pk_U
+
+    return rows
 
-def _run_generic(cfg: BenchConfig, params, sample_H, scheme_name: str, rsa_modulus: int | None = None) -> None:
+
+# Per-process state of a --parallel worker, set once by _init_worker.
+_WORKER: tuple | None = None
+
+
+def _init_worker(cfg: BenchConfig, factors, sk_C, head: tuple, lens: tuple, h_per_rep: int, cpus) -> None:
+    """
+    Rebuild params in the worker (Params holds closures, which do not pickle)
+    and pin it to its own CPU. pk_C is re-derived from sk_C: KeyGen is
+    deterministic. Each worker then runs cfg.warmup reps of its own and
+    discards them, so no worker records its first measured reps cold.
+    """
+    global _WORKER
+    _pin_process(cpus.get())
+    params, sample_H = _build_params(cfg, factors)
+    if cfg.presample:
+        sample_H = _PresampledH(sample_H)
+    ca = None if sk_C is None else (sk_C, params.keygen(sk_C))
+    _WORKER = (cfg, params, sample_H, ca, head, lens, h_per_rep)
+    for i in range(cfg.warmup):
+        _run_rep(cfg, params, sample_H, ca, i, head, lens, h_per_rep)
+
+
+def _worker_rep(i: int) -> list[tuple]:
+    cfg, params, sample_H, ca, head, lens, h_per_rep = _WORKER
+    return _run_rep(cfg, params, sample_H, ca, i, head, lens, h_per_rep)
+
+
+def _run_generic(
+    cfg: BenchConfig,
+    params,
+    sample_H,
+    scheme_name: str,
+    rsa_modulus: int | None = None,
+    factors: tuple[int, int] | None = None,
+) -> None:
     os.makedirs(os.path.dirname(cfg.out), exist_ok=True)
 
     pk_len_bytes, sk_len_bytes = _pk_sk_lengths_bytes(scheme_name, rsa_modulus=rsa_modulus)
 
-    with open(cfg.out, "w", newline="") as f:
-        w = csv.DictWriter(
-            f,
-            fieldnames=[
-                "scheme",
-                "bits",
-                "lam",
-                "op",
-                "warmup",
-                "rep",
-                "elapsed_ns",
-                "icert_len_bytes",
-                "pk_len_bytes",
-                "sk_len_bytes",
-            ],
-        )
-        w.writeheader()
-
-        for i in range(cfg.warmup + cfg.reps):
+    # Rows are buffered and written once after all reps, keeping CSV
+    # formatting and file I/O away from the measured operations.
+    rows_out: list[tuple] = []
+    append = rows_out.append
+
+    # --summary-only: fold measured rows into per-op summaries instead.
+    summaries: dict[str, _OpSummary] = {}
+    if cfg.summary_only:
+        def append(row: tuple) -> None:
+            if not row[4]:  # warmup
+                summaries.setdefault(row[3], _OpSummary()).update(row[6], row[7])
+    head = (scheme_name, cfg.bits, cfg.lam)
+    lens = (pk_len_bytes, sk_len_bytes)
+
+    if cfg.presample:
+        sample_H = _PresampledH(sample_H)
+    h_per_rep = _H_SAMPLES_ICERT + (_H_SAMPLES_SETUP if cfg.fresh_ca else 0)
+
+    n_reps = cfg.warmup + cfg.reps
+
+    # ------------------------------------------------------------
+    # Setup: the CA key is long-term, so by default one key pair serves all
+    # reps. Setup itself is still timed over the usual warmup + reps loop
+    # (those key pairs are discarded); --fresh-ca instead redoes it per rep.
+    # ------------------------------------------------------------
+    ca = None
+    if not cfg.fresh_ca:
+        ca = Setup(params, sample_H)
+        for i in range(n_reps):
             is_warmup = 1 if i < cfg.warmup else 0
-            rep = i if is_warmup else i - cfg.warmup
-
-            # ------------------------------------------------------------
-            # Setup (time it and record as a separate op row)
-            # ------------------------------------------------------------
-            setup_holder = {}
-
-            def _do_setup():
-                setup_holder["sk_C"], setup_holder["pk_C"] = Setup(params, sample_H)
-
-            t_setup = _timed_ns(_do_setup)
-            sk_C = setup_holder["sk_C"]
-            pk_C = setup_holder["pk_C"]
-
-            _write_row(
-                w,
-                scheme_name,
-                cfg.bits,
-                cfg.lam,
-                "Setup",
-                is_warmup,
-                rep,
-                t_setup,
-                0,  # no iCert at setup time
-                pk_len_bytes,
-                sk_len_bytes,
-            )
-
-            # ------------------------------------------------------------
-            # iCertGen
-            # ------------------------------------------------------------
-            holder = {}
-
-            def _do_icertgen():
-                (iCer, _), (_, view_U) = iCertGen(params, cfg.identity, sk_C, sample_H)
-                holder["iCer"] = iCer
-                holder["view_U"] = view_U
-
-            t_icert = _timed_ns(_do_icertgen)
-            iCer = holder["iCer"]
-            view_U = holder["view_U"]
-
-            _write_row(
-                w,
-                scheme_name,
-                cfg.bits,
-                cfg.lam,
-                "iCertGen",
-                is_warmup,
-                rep,
-                t_icert,
-                len(iCer),
-                pk_len_bytes,
-                sk_len_bytes,
-            )
-
-            # ------------------------------------------------------------
-            # SKGen
-            # ------------------------------------------------------------
-            holder2 = {}
-
-            def _do_skgen():
-                holder2["sk_U"] = SKGen(params, view_U, iCer)
-
-            t_skgen = _timed_ns(_do_skgen)
-            sk_U = holder2["sk_U"]
-
-            _write_row(
-                w,
-                scheme_name,
-                cfg.bits,
-                cfg.lam,
-                "SKGen",
-                is_warmup,
-                rep,
-                t_skgen,
-                len(iCer),
-                pk_len_bytes,
-                sk_len_bytes,
-            )
-
-            # ------------------------------------------------------------
-            # PKRecon
-            # ------------------------------------------------------------
-            def _do_pkrecon():
-                PKRecon(params, iCer, pk_C)
-
-            t_pkrecon = _timed_ns(_do_pkrecon)
-
-            _write_row(
-                w,
-                scheme_name,
-                cfg.bits,
-                cfg.lam,
-                "PKRecon",
-                is_warmup,
-                rep,
-                t_pkrecon,
-                len(iCer),
-                pk_len_bytes,
-                sk_len_bytes,
-            )
-
-            # ------------------------------------------------------------
-            # Correctness check (same as your original logic)
-            # ------------------------------------------------------------
-            if not is_warmup:
-                pk_U = PKRecon(params, iCer, pk_C)
-                assert pk_U is not None
-                assert params.keygen(sk_U) == pk_U
+            if cfg.presample:
+                sample_H.refill(_H_SAMPLES_SETUP)
+            t_setup, _ = _timed_ns(Setup, params, sample_H)
+
+            append((*head, "Setup", is_warmup, i if is_warmup else i - cfg.warmup, t_setup, 0, *lens))
+
+    if cfg.jobs == 1:
+        for i in range(n_reps):
+            for row in _run_rep(cfg, params, sample_H, ca, i, head, lens, h_per_rep):
+                append(row)
+    else:
+        # Reps are independent: fan them out to one pinned worker per CPU.
+        # Concurrent workers share caches and memory bandwidth, so this
+        # measures throughput rather than isolated latency. The warmup rows
+        # are recorded here in the parent, so the raw CSV has the same shape
+        # as a serial run; every worker additionally warms up on its own (not
+        # recorded), so only measured reps are mapped.
+        for i in range(cfg.warmup):
+            for row in _run_rep(cfg, params, sample_H, ca, i, head, lens, h_per_rep):
+                append(row)
+        try:
+            cpu_ids = sorted(os.sched_getaffinity(0))
+        except AttributeError:
+            cpu_ids = list(range(os.cpu_count() or 1))
+        jobs = cfg.jobs or len(cpu_ids)
+        cpus = mp.SimpleQueue()
+        for k in range(jobs):
+            cpus.put(cpu_ids[k % len(cpu_ids)])
+        sk_C = None if ca is None else ca[0]
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_worker,
+            initargs=(cfg, factors, sk_C, head, lens, h_per_rep, cpus),
+        ) as ex:
+            for rows in ex.map(_worker_rep, range(cfg.warmup, n_reps), chunksize=max(1, cfg.reps // (4 * jobs))):
+                for row in rows:
+                    append(row)
+
+    if cfg.summary_only:
+        rows_out = [(*head, op, *summ.stats(), *lens) for op, summ in summaries.items()]
+
+    with open(cfg.out, "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(SUMMARY_COLUMNS if cfg.summary_only else RAW_COLUMNS)
+        w.writerows(rows_out)
 
 
 def run_gq(cfg: BenchConfig) -> None:
-    N = gen_rsa_modulus(bits=cfg.bits)
-    params, sample_H = make_gq_params(N=N, e_rsa=cfg.e_rsa, lam=cfg.lam)
-    _run_generic(cfg, params, sample_H, "gq", rsa_modulus=N)
+    factors = gen_rsa_primes(bits=cfg.bits)
+    params, sample_H = _build_params(cfg, factors)
+    _run_generic(cfg, params, sample_H, "gq", rsa_modulus=factors[0] * factors[1], factors=factors)
 
 
 def run_schnorr(cfg: BenchConfig) -> None:
-    params, sample_H = make_schnorr_params(lam=cfg.lam)
+    params, sample_H = _build_params(cfg)
     _run_generic(cfg, params, sample_H, "schnorr")
 
 
 def run_bls(cfg: BenchConfig) -> None:
-    params, sample_H = make_bls_params(lam=cfg.lam)
+    params, sample_H = _build_params(cfg)
     _run_generic(cfg, params, sample_H, "bls")
 
 
@@ -269,8 +442,68 @@ def main() -> None:
     ap.add_argument("--reps", type=int, default=200)
     ap.add_argument("--out", type=str, default="bench/outputs/out.csv")
     ap.add_argument("--id", type=str, default="alice")
+    ap.add_argument(
+        "--summary-only",
+        action="store_true",
+        help="Write one summary row per op (streaming P^2 percentiles) instead of raw rows",
+    )
+    ap.add_argument(
+        "--check",
+        choices=["none", "first", "last", "all"],
+        default="first",
+        help="Measured reps on which to verify KeyGen(sk_U) == pk_U (default: first)",
+    )
+    ap.add_argument(
+        "--presample",
+        action="store_true",
+        help="Draw secret-key samples between reps so RNG cost is excluded from timings",
+    )
+    ap.add_argument(
+        "--fresh-ca",
+        action="store_true",
+        help="Issue every rep under a fresh CA key pair (Setup timed inside the rep) instead of one long-lived key",
+    )
+    ap.add_argument(
+        "--trust-encoding",
+        action="store_true",
+        help="Skip R_U validation in Decode (BLS on-curve re-check, GQ gcd); iCer comes from our own iCertGen",
+    )
+    ap.add_argument(
+        "--fuse-keygen",
+        action="store_true",
+        help="iCertGen computes R_U = KeyGen(k_U + k_C) with one KeyGen (not the two-party Fig.1 cost)",
+    )
+    ap.add_argument(
+        "--crt",
+        action="store_true",
+        help="GQ KeyGen via CRT with the modulus factors, for every party (not the Fig.1 user cost)",
+    )
+    ap.add_argument(
+        "--parallel",
+        type=int,
+        nargs="?",
+        const=0,
+        default=1,
+        metavar="JOBS",
+        help="Run reps in JOBS pinned worker processes (no value: one per CPU). "
+        "Warmup rows are recorded in the parent; each worker also warms up on its own. "
+        "Measures throughput, not isolated latency; default: serial",
+    )
+    ap.add_argument(
+        "--bls-backend",
+        choices=["pyecc", "blspy"],
+        default="pyecc",
+        help="G1 implementation for --scheme bls (blspy is C-backed; default: pyecc)",
+    )
+    ap.add_argument("--pin-cpu", type=int, default=None, help="Pin the benchmark process to this CPU (Linux)")
     args = ap.parse_args()
 
+    if args.parallel < 0:
+        ap.error("--parallel JOBS must be >= 0")
+
+    if args.pin_cpu is not None:
+        _pin_process(args.pin_cpu)
+
     bits, lam = _apply_security_profile(args.scheme, args.bits, args.lam, args.sec)
 
     cfg = BenchConfig(
@@ -282,6 +515,15 @@ def main() -> None:
         reps=args.reps,
         out=args.out,
         identity=args.id.encode(),
+        summary_only=args.summary_only,
+        check=args.check,
+        presample=args.presample,
+        fresh_ca=args.fresh_ca,
+        trust_encoding=args.trust_encoding,
+        fuse_keygen=args.fuse_keygen,
+        jobs=args.parallel,
+        bls_backend=args.bls_backend,
+        crt=args.crt,
     )
 
     if cfg.scheme == "gq":
@@ -1,32 +1,35 @@
 from __future__ import annotations
 
-from typing import Optional, Tuple, TypeVar
+from typing import Optional, Tuple
 
-E = TypeVar("E")
+# Byte-length prefix of the encoded integer (big-endian).
+_LEN_BYTES = 2
 
 
-def encode_simple(R: E, identity: bytes) -> bytes:
-    """Injective deterministic encoding for prototype use.
+def encode_simple(R: int, identity: bytes) -> bytes:
+    """Injective deterministic encoding for prototype use (integer E).
 
-    We encode as: b"R=" + repr(R).encode() + b"|id=" + identity
-    This is reversible only if repr(R) can be parsed. For the prototype,
-    we'll instead supply instantiation-specific encode/decode when needed.
-
-    For correctness tests we will use integer E, where parsing is easy.
+    We encode as: b"R=" + len(R_bytes) (2 bytes) + R_bytes + b"|id=" + identity
+    where R_bytes is R in big-endian two's complement, length-prefixed, with
+    (R.bit_length() + 8) // 8 bytes: always room for the sign bit, so not
+    minimal for some negatives (e.g. -128 takes 2 bytes). Binary avoids
+    str(R), whose decimal conversion is superlinear for large ints.
+    Real instantiations supply their own fixed-width encode/decode.
     """
-    return b"R=" + str(R).encode("utf-8") + b"|id=" + identity
+    R_bytes = R.to_bytes((R.bit_length() + 8) // 8, "big", signed=True)
+    return b"R=" + len(R_bytes).to_bytes(_LEN_BYTES, "big") + R_bytes + b"|id=" + identity
 
 
 def decode_simple_int(iCer: bytes) -> Optional[Tuple[int, bytes]]:
     """Decode for the simple integer-E case. Returns None as ⊥ on malformed input."""
     try:
-        parts = iCer.split(b"|id=", 1)
-        if len(parts) != 2:
+        if not iCer.startswith(b"R="):
             return None
-        left, identity = parts
-        if not left.startswith(b"R="):
+        start = 2 + _LEN_BYTES
+        end = start + int.from_bytes(iCer[2:start], "big")
+        if len(iCer) < end + 4 or iCer[end:end + 4] != b"|id=":
             return None
-        R = int(left[2:].decode("utf-8"))
-        return R, identity
+        R = int.from_bytes(iCer[start:end], "big", signed=True)
+        return R, iCer[end + 4:]
     except Exception:
         return None
@@ -7,14 +7,64 @@ from .interfaces import Decode, EGroupOps, Encode, HGroupOps, KeyGen
 
 H = TypeVar("H")
 E = TypeVar("E")
+T = TypeVar("T")
+
+# Fallback ladders switch from plain binary to a w-bit sliding window for
+# scalars of at least this many bits (e.g. λ-bit RO outputs).
+_WINDOW_BITS = 4
+_WINDOW_MIN_BITS = 32
+
+
+def _sliding_window(op: Callable[[T, T], T], a: int, x: T) -> T:
+    """Left-to-right sliding-window evaluation of a ⊙ x for a > 0 under group law op.
+
+    Precomputes the odd multiples x, 3x, ..., (2^w - 1)x, then scans a from the
+    MSB, consuming runs of up to w bits that end in a 1 with one table lookup.
+    """
+    x2 = op(x, x)
+    table = [x]
+    for _ in range((1 << (_WINDOW_BITS - 1)) - 1):
+        table.append(op(table[-1], x2))
+
+    res: Optional[T] = None  # identity, without spending group ops on it
+    i = a.bit_length() - 1
+    while i >= 0:
+        if not (a >> i) & 1:
+            res = op(res, res) if res is not None else None
+            i -= 1
+            continue
+        j = max(i - _WINDOW_BITS + 1, 0)
+        while not (a >> j) & 1:
+            j += 1
+        width = i - j + 1
+        if res is not None:
+            for _ in range(width):
+                res = op(res, res)
+        val = table[((a >> j) & ((1 << width) - 1)) >> 1]
+        res = op(res, val) if res is not None else val
+        i = j - 1
+    assert res is not None
+    return res
 
 
 def z_action_H(ops: HGroupOps[H], a: int, h: H) -> H:
-    """Compute a ⊙_H h using group law ⊕ (double-and-add), supporting a<0."""
+    """Compute a ⊙_H h using group law ⊕ (double-and-add), supporting a<0.
+
+    If the group provides a native ops.scalar_mul(a, h), it is used instead.
+    If it exposes its (public) order, a is first reduced into [0, order).
+    """
+    order = getattr(ops, "order", None)
+    if order is not None:
+        a %= order
+    scalar_mul = getattr(ops, "scalar_mul", None)
+    if scalar_mul is not None:
+        return scalar_mul(a, h)
     if a == 0:
         return ops.zero()
     if a < 0:
         return z_action_H(ops, -a, ops.neg(h))
+    if a.bit_length() >= _WINDOW_MIN_BITS:
+        return _sliding_window(ops.add, a, h)
 
     res = ops.zero()
     base = h
@@ -28,11 +78,23 @@ def z_action_H(ops: HGroupOps[H], a: int, h: H) -> H:
 
 
 def z_action_E(ops: EGroupOps[E], a: int, X: E) -> E:
-    """Compute a ⊙_E X using group law ⊗ (square-and-multiply), supporting a<0."""
+    """Compute a ⊙_E X using group law ⊗ (square-and-multiply), supporting a<0.
+
+    If the group provides a native ops.scalar_mul(a, X), it is used instead.
+    If it exposes its (public) order, a is first reduced into [0, order).
+    """
+    order = getattr(ops, "order", None)
+    if order is not None:
+        a %= order
+    scalar_mul = getattr(ops, "scalar_mul", None)
+    if scalar_mul is not None:
+        return scalar_mul(a, X)
     if a == 0:
         return ops.one()
     if a < 0:
         return z_action_E(ops, -a, ops.inv(X))
+    if a.bit_length() >= _WINDOW_MIN_BITS:
+        return _sliding_window(ops.mul, a, X)
 
     res = ops.one()
     base = X
@@ -79,6 +141,7 @@ def iCertGen(
     identity: bytes,
     sk_C: H,
     sample_H: Callable[[], H],
+    fuse_keygen: bool = False,
 ) -> Tuple[Tuple[bytes, ViewCA[H]], Tuple[bytes, ViewU[H]]]:
     """Issuance: implement Fig.1 exactly (collapsed into one function).
 
@@ -96,14 +159,20 @@ def iCertGen(
     Views:
       view_U := (k_U, r)
       view_CA := (k_C, r)
+
+    fuse_keygen: since KeyGen is a homomorphism, R_U = KeyGen(k_U ⊕ k_C) with a
+    single KeyGen. Only possible because both parties are collapsed here (the
+    CA never learns k_U in the real protocol); off by default so timings keep
+    reflecting Fig.1.
     """
     k_U = sample_H()
-    K_U = params.keygen(k_U)
-
     k_C = sample_H()
-    K_C = params.keygen(k_C)
-
-    R_U = params.E_ops.mul(K_U, K_C)
+    if fuse_keygen:
+        R_U = params.keygen(params.H_ops.add(k_U, k_C))
+    else:
+        K_U = params.keygen(k_U)
+        K_C = params.keygen(k_C)
+        R_U = params.E_ops.mul(K_U, K_C)
     iCer = params.Encode(R_U, identity)
 
     e = params.RO(iCer)
@@ -112,17 +181,27 @@ def iCertGen(
     return (iCer, ViewCA(k_C=k_C, r=r)), (iCer, ViewU(k_U=k_U, r=r))
 
 
-def SKGen(params: Params[H, E], view_U: ViewU[H], iCer: bytes) -> H:
-    """User-side reconstruction: sk_U := (e ⊙_H k_U) ⊕ r."""
-    e = params.RO(iCer)
+def SKGen(params: Params[H, E], view_U: ViewU[H], iCer: bytes, e: Optional[int] = None) -> H:
+    """User-side reconstruction: sk_U := (e ⊙_H k_U) ⊕ r.
+
+    e := RO(iCer) may be passed in when the caller already holds it.
+    """
+    if e is None:
+        e = params.RO(iCer)
     return params.H_ops.add(z_action_H(params.H_ops, e, view_U.k_U), view_U.r)
 
 
-def PKRecon(params: Params[H, E], iCer: bytes, pk_C: E) -> Optional[E]:
-    """Verifier-side reconstruction: pk_U := (e ⊙_E R_U) ⊗ pk_C, or ⊥ if malformed."""
+def PKRecon(params: Params[H, E], iCer: bytes, pk_C: E, e: Optional[int] = None) -> Optional[E]:
+    """Verifier-side reconstruction: pk_U := (e ⊙_E R_U) ⊗ pk_C, or ⊥ if malformed.
+
+    e := RO(iCer) may be passed in when the caller already holds it.
+    """
     decoded = params.Decode(iCer)
     if decoded is None:
         return None
     R_U, _id = decoded
-    e = params.RO(iCer)
-    return params.E_ops.mul(z_action_E(params.E_ops, e, R_U), pk_C)
+    if e is None:
+        e = params.RO(iCer)
+    pk_U = params.E_ops.mul(z_action_E(params.E_ops, e, R_U), pk_C)
+    canonicalize = getattr(params.E_ops, "canonicalize", None)
+    return canonicalize(pk_U) if canonicalize is not None else pk_U
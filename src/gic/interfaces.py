@@ -14,14 +14,31 @@ class KeyGen(Protocol[H, E]):
 
 
 class HGroupOps(Protocol[H]):
-    """Secret-key group (𝓗, ⊕) operations."""
+    """Secret-key group (𝓗, ⊕) operations.
+
+    Implementations may also provide scalar_mul(a, h) -> a ⊙_H h (a ∈ Z) as a
+    native fast path; core falls back to double-and-add over ⊕ otherwise.
+    An optional `order` attribute (public group order, e.g. q for Z_q) lets
+    core reduce scalars first. Only set it when every element that can reach
+    the ops has order dividing it (e.g. a prime-order group); omit it when the
+    order is secret (Z_N^*) or when decoded elements may lie outside the
+    prime-order subgroup (curves with cofactor > 1 and no subgroup check).
+    """
     def zero(self) -> H: ...
     def add(self, left: H, right: H) -> H: ...
     def neg(self, value: H) -> H: ...
 
 
 class EGroupOps(Protocol[E]):
-    """Public-key group (𝓔, ⊗) operations."""
+    """Public-key group (𝓔, ⊗) operations.
+
+    Implementations may also provide scalar_mul(a, X) -> a ⊙_E X (a ∈ Z) as a
+    native fast path; core falls back to square-and-multiply over ⊗ otherwise.
+    An optional `order` attribute works as for HGroupOps.
+    If elements have several representations (e.g. projective points), an
+    optional canonicalize(X) is applied to PKRecon's result so it compares
+    equal to KeyGen outputs.
+    """
     def one(self) -> E: ...
     def mul(self, left: E, right: E) -> E: ...
     def inv(self, value: E) -> E: ...
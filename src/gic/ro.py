@@ -1,9 +1,47 @@
 from __future__ import annotations
 
 from hashlib import sha256
+from typing import Callable
 
 
-def ro_default(iCer: bytes, lam: int = 128) -> int:
-    """Deterministic stand-in for a random oracle: {0,1}* -> {1,...,2^lam}."""
-    h = int.from_bytes(sha256(iCer).digest(), "big")
+def ro_default(iCer: bytes, lam: int = 128, domain: bytes = b"") -> int:
+    """Deterministic stand-in for a random oracle: {0,1}* -> {1,...,2^lam}.
+
+    A non-empty domain tag is prepended to iCer before hashing (domain separation).
+    """
+    h = int.from_bytes(sha256(domain + iCer).digest(), "big")
     return 1 + (h % (2**lam))
+
+
+def make_ro(lam: int = 128, domain: bytes = b"") -> Callable[[bytes], int]:
+    """Return iCer -> ro_default(iCer, lam, domain) with lam and domain folded in.
+
+    The domain tag is absorbed once into a base sha256 context; each query only
+    copies that context and hashes iCer (for an empty tag the copy is no slower
+    than a fresh sha256()).
+    2^lam is a power of two, so the reduction is a mask; the hash context and the
+    mask are bound as defaults (fast locals) to avoid a lambda + keyword call per
+    RO query. When lam is a whole number of bytes (<= 256), the low lam bits are
+    simply the last lam/8 digest bytes, so those are sliced off and converted
+    directly, skipping the full 256-bit int and the mask.
+    """
+    base = sha256(domain)
+
+    if lam % 8 == 0 and 0 < lam <= 256:
+        start = -(lam // 8)
+
+        def ro(iCer: bytes, _copy=base.copy, _from_bytes=int.from_bytes, _start=start) -> int:
+            h = _copy()
+            h.update(iCer)
+            return 1 + _from_bytes(h.digest()[_start:], "big")
+
+        return ro
+
+    mask = (1 << lam) - 1
+
+    def ro(iCer: bytes, _copy=base.copy, _mask=mask) -> int:
+        h = _copy()
+        h.update(iCer)
+        return 1 + (int.from_bytes(h.digest(), "big") & _mask)
+
+    return ro
@@ -7,7 +7,7 @@ from typing import Callable, Optional, Tuple
 import secrets
 
 from gic.core import Params
-from gic.ro import ro_default
+from gic.ro import make_ro
 
 # py_ecc for BLS12-381 G1 group ops + point compression (no pairing).
 # Install: pip install py-ecc
@@ -35,8 +35,10 @@ except Exception as e:  # pragma: no cover
 # Point representation note (important!)
 # - py_ecc optimized curve arithmetic expects Jacobian points (x, y, z).
 # - normalize(P) returns affine (x, y).
-# We canonicalize for equality (affine), but must convert back to Jacobian
-# before calling add/neg/multiply to avoid IndexError.
+# Every point handed out by this module (KeyGen, Decode, group ops) is
+# Jacobian, so G1Ops can call py_ecc directly. The canonical form used for
+# equality is Jacobian with z = 1 (Z1 for infinity); _to_jacobian is only
+# needed for points that come from outside (e.g. affine tuples).
 # ----------------------------
 
 def _to_jacobian(P):
@@ -61,13 +63,15 @@ def _to_jacobian(P):
 
 
 def _canon_g1(P):
-    """Canonicalize for stable equality: affine for non-infinity, Z1 for infinity."""
+    """Canonicalize for stable equality: Jacobian (x, y, 1), or Z1 for infinity."""
     if P is None:
         return None
     try:
-        if is_inf(P):
+        PJ = _to_jacobian(P)
+        if PJ[2] == PJ[2].zero():
             return Z1
-        return normalize(_to_jacobian(P))  # affine (x, y)
+        x, y = normalize(PJ)
+        return (x, y, x.one())
     except Exception:
         return P
 
@@ -77,10 +81,14 @@ def _canon_g1(P):
 # Core expects: zero/one/add/neg and also mul/inv as aliases.
 # ----------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ZqOps:
     q: int
 
+    @property
+    def order(self) -> int:
+        return self.q
+
     def zero(self) -> int:
         return 0
 
@@ -94,18 +102,25 @@ class ZqOps:
         return (-a) % self.q
 
     # aliases expected by core naming
-    def mul(self, a: int, b_: int) -> int:
-        return self.add(a, b_)
+    mul = add
+    inv = neg
 
-    def inv(self, a: int) -> int:
-        return self.neg(a)
+    # a ⊙ x = a*x mod q
+    def scalar_mul(self, a: int, x: int) -> int:
+        return (a * x) % self.q
 
 
 # ----------------------------
 # E: BLS12-381 G1 as an additive group (public keys)
 # Core expects: one/mul/inv.
-# We canonicalize outputs (affine) for stable equality, but convert inputs
-# back to Jacobian before calling py_ecc arithmetic.
+# Group ops work on Jacobian points and do NOT canonicalize: normalize() costs
+# a field inversion, and intermediate points are never compared. Equality is
+# only needed on final values, so canonicalize() is applied at the boundary
+# (KeyGen output, PKRecon result). Inputs are always Jacobian here (see the
+# representation note), so the ops call py_ecc without conversion.
+# No `order` attribute: decode checks on-curve but not subgroup membership,
+# and E(F_p) has cofactor > 1, so reducing e mod r would change e ⊙ R_U for
+# an R_U outside G1.
 # ----------------------------
 
 @dataclass(frozen=True)
@@ -117,17 +132,26 @@ class G1Ops:
         return Z1
 
     def add(self, A, B):
-        return _canon_g1(add(_to_jacobian(A), _to_jacobian(B)))
+        return add(A, B)
 
     def neg(self, A):
-        return _canon_g1(neg(_to_jacobian(A)))
+        return neg(A)
 
     # aliases expected by core naming
     def mul(self, A, B):
-        return _canon_g1(add(_to_jacobian(A), _to_jacobian(B)))
+        return add(A, B)
 
     def inv(self, A):
-        return _canon_g1(neg(_to_jacobian(A)))
+        return neg(A)
+
+    # a ⊙ A via py_ecc's scalar multiplication (handles a<0 by negating A)
+    def scalar_mul(self, a: int, A):
+        if a < 0:
+            A, a = neg(A), -a
+        return multiply(A, a)
+
+    def canonicalize(self, A):
+        return _canon_g1(A)
 
 
 # ----------------------------
@@ -138,64 +162,61 @@ class G1Ops:
 # ----------------------------
 
 _RU_LEN = 48  # BLS12-381 G1 compressed size
-
-
-def _int_to_fixed_bytes(x: int, length: int) -> bytes:
-    return x.to_bytes(length, "big")
-
-
-def _int_from_fixed_bytes(bts: bytes) -> int:
-    return int.from_bytes(bts, "big")
+# Offsets of b"|id=" and of the identity in the layout above (shared with
+# inst_blspy.py, which uses the same encoding)
+_SEP_AT = 2 + _RU_LEN
+_ID_AT = _SEP_AT + 4
 
 
 def _g1_to_bytes_compressed(P) -> bytes:
     # compress_G1 expects a Jacobian point in optimized form
-    PJ = _to_jacobian(P)
-    c = compress_G1(PJ)
-    return _int_to_fixed_bytes(int(c), _RU_LEN)
+    c = compress_G1(P)
+    return int(c).to_bytes(_RU_LEN, "big")
 
 
-def _g1_from_bytes_compressed(buf: bytes):
+def _g1_from_bytes_compressed(buf: bytes, skip_validation: bool = False):
     if len(buf) != _RU_LEN:
         return None
-    c = _int_from_fixed_bytes(buf)
+    c = int.from_bytes(buf, "big")
     try:
         P = decompress_G1(c)  # typically returns Jacobian point
     except Exception:
         return None
+    if skip_validation:
+        # decompress_G1 already rejects x with no y on y^2 = x^3 + b and
+        # returns (x, y, 1), i.e. the canonical form.
+        return P
     # Validate on-curve using Jacobian form
     try:
         if not is_on_curve(P, b):
             return None
     except Exception:
         return None
-    # Return canonical affine (stable equality) while ops will convert back when needed
+    # Return the canonical (z = 1) Jacobian form for stable equality
     return _canon_g1(P)
 
 
-def make_encode_decode_bls_g1() -> tuple[
+def make_encode_decode_bls_g1(unsafe_skip_validation: bool = False) -> tuple[
     Callable[[object, bytes], bytes],
     Callable[[bytes], Optional[Tuple[object, bytes]]],
 ]:
+    """
+    unsafe_skip_validation: skip the explicit is_on_curve re-check (and the
+    re-canonicalization) of the decoded R_U. Decompression still enforces
+    the curve equation, so this only drops a redundant check and the field
+    inversion of _canon_g1; neither mode performs a subgroup check.
+    """
     def encode(RU, identity: bytes) -> bytes:
         return b"R=" + _g1_to_bytes_compressed(RU) + b"|id=" + identity
 
     def decode(iCer: bytes) -> Optional[Tuple[object, bytes]]:
         try:
-            if not iCer.startswith(b"R="):
-                return None
-            rest = iCer[2:]
-            if len(rest) < _RU_LEN + 4:  # RU + b"|id="
+            if len(iCer) < _ID_AT or iCer[:2] != b"R=" or iCer[_SEP_AT:_ID_AT] != b"|id=":
                 return None
-            RU_bytes = rest[:_RU_LEN]
-            tail = rest[_RU_LEN:]
-            if not tail.startswith(b"|id="):
-                return None
-            identity = tail[4:]
-            RU = _g1_from_bytes_compressed(RU_bytes)
+            RU = _g1_from_bytes_compressed(iCer[2:_SEP_AT], unsafe_skip_validation)
             if RU is None:
                 return None
-            return RU, identity
+            return RU, iCer[_ID_AT:]
         except Exception:
             return None
 
@@ -204,7 +225,7 @@ def make_encode_decode_bls_g1() -> tuple[
 
 # ----------------------------
 # KeyGen(s) = s * G1 (no pairing)
-# Canonicalize output to affine for stable equality.
+# Canonicalize output (Jacobian, z = 1) for stable equality.
 # ----------------------------
 
 def make_keygen_bls_g1(q: int) -> Callable[[int], object]:
@@ -212,7 +233,7 @@ def make_keygen_bls_g1(q: int) -> Callable[[int], object]:
         s = int(s) % q
         if s == 0:
             raise ValueError("Secret key must be nonzero in Z_q")
-        return _canon_g1(multiply(G1, s))  # multiply returns Jacobian; canon -> affine
+        return _canon_g1(multiply(G1, s))  # multiply returns Jacobian; canon -> z = 1
     return keygen
 
 
@@ -230,7 +251,11 @@ def make_sampler_zq(q: int) -> Callable[[], int]:
 # Params factory (plug-in for core Figure 1)
 # ----------------------------
 
-def make_bls_params(lam: int = 128) -> tuple[Params[int, object], Callable[[], int]]:
+def make_bls_params(
+    lam: int = 128,
+    unsafe_skip_validation: bool = False,
+    backend: str = "pyecc",
+) -> tuple[Params[int, object], Callable[[], int]]:
     """
     Return (params, sample_H) for BLS12-381 G1 instantiation (no pairing).
 
@@ -238,11 +263,21 @@ def make_bls_params(lam: int = 128) -> tuple[Params[int, object], Callable[[], i
     - E: G1 additive group (public keys)
     - KeyGen(s) = s * G1
     - Encode/Decode uses compressed G1 (48 bytes)
+    - unsafe_skip_validation: see make_encode_decode_bls_g1
+    - backend: "pyecc" (pure Python, default) or "blspy" (C-backed G1,
+      see inst_blspy.py; same group and encoding)
     """
+    if backend == "blspy":
+        from .inst_blspy import make_bls_params_blspy
+
+        return make_bls_params_blspy(lam=lam, unsafe_skip_validation=unsafe_skip_validation)
+    if backend != "pyecc":
+        raise ValueError(f"Unsupported BLS backend={backend!r}.")
+
     q = int(curve_order)
     H_ops = ZqOps(q=q)
     E_ops = G1Ops()
-    encode, decode = make_encode_decode_bls_g1()
+    encode, decode = make_encode_decode_bls_g1(unsafe_skip_validation)
     keygen = make_keygen_bls_g1(q)
 
     params = Params(
@@ -251,7 +286,7 @@ def make_bls_params(lam: int = 128) -> tuple[Params[int, object], Callable[[], i
         E_ops=E_ops,
         Encode=encode,
         Decode=decode,
-        RO=lambda cer: ro_default(cer, lam=lam),
+        RO=make_ro(lam),
     )
     sample_H = make_sampler_zq(q)
     return params, sample_H
@@ -0,0 +1,123 @@
+# src/instantiations/bls/inst_blspy.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+
+from gic.core import Params
+from gic.ro import make_ro
+
+from .inst import _ID_AT, _SEP_AT, ZqOps, curve_order, make_sampler_zq
+
+# C-backed BLS12-381 G1 via `blspy` (optional backend; same group, same
+# 48-byte compressed encoding as the py_ecc instantiation).
+# Install: pip install blspy
+try:
+    from blspy import G1Element, PrivateKey
+except Exception as e:  # pragma: no cover
+    raise ImportError(
+        "The blspy BLS backend requires 'blspy'. Install via: pip install blspy"
+    ) from e
+
+# BLS12-381 subgroup order r, shared with the py_ecc backend
+_CURVE_ORDER = int(curve_order)
+
+
+# ----------------------------
+# E: BLS12-381 G1 as an additive group (public keys), on blspy.G1Element
+# blspy only exposes fixed-base scalar multiplication (PrivateKey.get_g1), so
+# there is no scalar_mul here: core's sliding-window ladder runs over the
+# C-level point addition for e ⊙ R_U.
+# No `order` attribute, as in G1Ops: G1Element.from_bytes_unchecked (the
+# unsafe_skip_validation decode) skips the subgroup check.
+# ----------------------------
+
+@dataclass(frozen=True)
+class G1OpsBlspy:
+    def zero(self):
+        return G1Element()
+
+    def one(self):
+        return G1Element()
+
+    def add(self, A, B):
+        return A + B
+
+    def neg(self, A):
+        return A.negate()
+
+    # aliases expected by core naming
+    def mul(self, A, B):
+        return A + B
+
+    def inv(self, A):
+        return A.negate()
+
+
+# ----------------------------
+# Encode/Decode for iCer = Encode(R_U, id)
+# Same layout as inst.py: b"R=" || RU48 || b"|id=" || id
+# ----------------------------
+
+def make_encode_decode_blspy_g1(unsafe_skip_validation: bool = False) -> tuple[
+    Callable[[object, bytes], bytes],
+    Callable[[bytes], Optional[Tuple[object, bytes]]],
+]:
+    """
+    unsafe_skip_validation: decode with G1Element.from_bytes_unchecked, which
+    skips blspy's on-curve/subgroup checks. Benchmark use only.
+    """
+    from_bytes = G1Element.from_bytes_unchecked if unsafe_skip_validation else G1Element.from_bytes
+
+    def encode(RU, identity: bytes) -> bytes:
+        return b"R=" + bytes(RU) + b"|id=" + identity
+
+    def decode(iCer: bytes) -> Optional[Tuple[object, bytes]]:
+        try:
+            if len(iCer) < _ID_AT or iCer[:2] != b"R=" or iCer[_SEP_AT:_ID_AT] != b"|id=":
+                return None
+            return from_bytes(iCer[2:_SEP_AT]), iCer[_ID_AT:]
+        except Exception:
+            return None
+
+    return encode, decode
+
+
+# ----------------------------
+# KeyGen(s) = s * G1 via blspy's fixed-base multiplication
+# ----------------------------
+
+def make_keygen_blspy_g1(q: int) -> Callable[[int], object]:
+    def keygen(s: int):
+        s = int(s) % q
+        if s == 0:
+            raise ValueError("Secret key must be nonzero in Z_q")
+        return PrivateKey.from_bytes(s.to_bytes(32, "big")).get_g1()
+    return keygen
+
+
+# ----------------------------
+# Params factory
+# ----------------------------
+
+def make_bls_params_blspy(
+    lam: int = 128,
+    unsafe_skip_validation: bool = False,
+) -> tuple[Params[int, object], Callable[[], int]]:
+    """
+    Return (params, sample_H) for BLS12-381 G1 backed by blspy.
+    Same H, KeyGen and encoding as make_bls_params; only E is C-backed.
+    """
+    q = _CURVE_ORDER
+    encode, decode = make_encode_decode_blspy_g1(unsafe_skip_validation)
+
+    params = Params(
+        keygen=make_keygen_blspy_g1(q),
+        H_ops=ZqOps(q=q),
+        E_ops=G1OpsBlspy(),
+        Encode=encode,
+        Decode=decode,
+        RO=make_ro(lam),
+    )
+    sample_H = make_sampler_zq(q)
+    return params, sample_H
@@ -1 +1 @@
-from .inst import make_gq_params, gen_rsa_modulus
+from .inst import make_gq_params, gen_rsa_modulus, gen_rsa_primes
@@ -1,36 +1,64 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Callable, Optional, Tuple
 from math import gcd as GCD
 import secrets
 
 from gic.core import Params
-from gic.ro import ro_default
+from gic.ro import make_ro
+
+try:
+    import gmpy2  # optional: GMP modexp is much faster than pow() at RSA sizes
+except ImportError:  # pragma: no cover
+    gmpy2 = None
 
 
 # ----------------------------
 # Primes / RSA modulus generation (stdlib, for tests/bench)
 # ----------------------------
 
-def _is_probable_prime(n: int, rounds: int = 20) -> bool:
+# All primes below 1000, starting at 2. They serve as trial divisors (which
+# reject most random candidates before any modexp is spent on them) and,
+# from the front of the tuple, as the Miller-Rabin bases 2, 3, 5, ...
+_SMALL_PRIMES = tuple(
+    p for p in range(2, 1000) if all(p % d for d in range(2, int(p ** 0.5) + 1))
+)
+
+
+# Miller-Rabin with the first 13 primes as bases is deterministic below this
+# bound (smallest strong pseudoprime to all of them).
+_MR_DETERMINISTIC_LIMIT = 3317044064679887385961981
+_MR_DETERMINISTIC_BASES = _SMALL_PRIMES[:13]
+
+
+def _is_probable_prime(n: int, rounds: int = 5) -> bool:
+    """
+    Primality test for prime generation. Candidates are random, not
+    adversarial, so above the deterministic range `rounds` Miller-Rabin tests
+    with fixed small-prime bases leave an error far below the worst-case
+    4^-rounds bound, and no CSPRNG draw is spent per witness.
+    """
     if n < 2:
         return False
-    small_primes = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
-    for p in small_primes:
+    for p in _SMALL_PRIMES:
         if n == p:
             return True
         if n % p == 0:
             return False
 
+    if gmpy2 is not None:
+        # GMP: more trial division + `rounds` Miller-Rabin tests, all in C
+        return bool(gmpy2.is_prime(n, rounds))
+
     d = n - 1
     s = 0
     while (d & 1) == 0:
         d >>= 1
         s += 1
 
-    for _ in range(rounds):
-        a = secrets.randbelow(n - 3) + 2
+    bases = _MR_DETERMINISTIC_BASES if n < _MR_DETERMINISTIC_LIMIT else _SMALL_PRIMES[:rounds]
+    for a in bases:
         x = pow(a, d, n)
         if x == 1 or x == n - 1:
             continue
@@ -49,16 +77,26 @@ def _get_prime(bits: int) -> int:
         p = secrets.randbits(bits)
         p |= (1 << (bits - 1))  # ensure bit length
         p |= 1                  # ensure odd
-        if _is_probable_prime(p):
-            return p
+        # Incremental search: walk odd candidates upward from the random start
+        # (about ln(2^bits)/2 steps on average) instead of resampling each time.
+        while p.bit_length() == bits:
+            if _is_probable_prime(p):
+                return p
+            p += 2
 
 
-def gen_rsa_modulus(bits: int = 2048) -> int:
-    """Generate RSA modulus N = p*q."""
+def gen_rsa_primes(bits: int = 2048) -> tuple[int, int]:
+    """Generate distinct primes (p, q) for a bits-bit RSA modulus N = p*q."""
     p = _get_prime(bits // 2)
     q = _get_prime(bits // 2)
     while q == p:
         q = _get_prime(bits // 2)
+    return p, q
+
+
+def gen_rsa_modulus(bits: int = 2048) -> int:
+    """Generate RSA modulus N = p*q."""
+    p, q = gen_rsa_primes(bits)
     return p * q
 
 
@@ -69,9 +107,15 @@ def gen_rsa_modulus(bits: int = 2048) -> int:
 #  - inv via modular inverse
 # ----------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ZStarOps:
     N: int
+    # gmpy2.mpz(N), built once per modulus (None without gmpy2)
+    _mpzN: object = field(init=False, repr=False, compare=False, default=None)
+
+    def __post_init__(self) -> None:
+        if gmpy2 is not None:
+            object.__setattr__(self, "_mpzN", gmpy2.mpz(self.N))
 
     def one(self) -> int:
         return 1
@@ -89,51 +133,47 @@ class ZStarOps:
         return pow(a, -1, self.N)
 
     # Alias for H-group add/neg (⊕ is multiplication)
-    def add(self, a: int, b: int) -> int:
-        return self.mul(a, b)
+    add = mul
+    neg = inv
 
-    def neg(self, a: int) -> int:
-        # inverse element in multiplicative group
-        return self.inv(a)
+    # a ⊙ x = x^a mod N via native modexp (a<0 inverts first);
+    # gmpy2.powmod when available, CPython's pow() otherwise
+    def scalar_mul(self, a: int, x: int) -> int:
+        if self._mpzN is not None:
+            return int(gmpy2.powmod(x, a, self._mpzN))
+        return pow(x, a, self.N)
 
 
 # ----------------------------
 # Encode/Decode for iCer = Encode(R_U, id)
 # ----------------------------
 
-def _int_to_fixed_bytes(x: int, length: int) -> bytes:
-    return x.to_bytes(length, "big")
-
-
-def _int_from_fixed_bytes(b: bytes) -> int:
-    return int.from_bytes(b, "big")
-
-
 def make_encode_decode_for_modulus(
     N: int,
+    unsafe_skip_validation: bool = False,
 ) -> tuple[Callable[[int, bytes], bytes], Callable[[bytes], Optional[Tuple[int, bytes]]]]:
+    """
+    unsafe_skip_validation: skip the gcd(R_U, N) == 1 membership check in
+    decode (a full-size bigint gcd). PKRecon only raises R_U to a positive
+    power, so a non-invertible R_U would NOT be caught downstream; only the
+    benchmark's --trust-encoding sets this.
+    """
     k = (N.bit_length() + 7) // 8  # fixed byte-length for elements mod N
+    sep = 2 + k  # R_U is always k bytes, so b"|id=" sits at a fixed offset
+    id_at = sep + 4
 
     def encode(RU: int, identity: bytes) -> bytes:
-        return b"R=" + _int_to_fixed_bytes(RU % N, k) + b"|id=" + identity
+        return b"R=" + (RU % N).to_bytes(k, "big") + b"|id=" + identity
 
     def decode(iCer: bytes) -> Optional[Tuple[int, bytes]]:
         try:
-            if not iCer.startswith(b"R="):
-                return None
-            rest = iCer[2:]
-            if len(rest) < k + 4:
-                return None
-            RU_bytes = rest[:k]
-            tail = rest[k:]
-            if not tail.startswith(b"|id="):
+            if len(iCer) < id_at or iCer[:2] != b"R=" or iCer[sep:id_at] != b"|id=":
                 return None
-            identity = tail[4:]
-            RU = _int_from_fixed_bytes(RU_bytes) % N
+            RU = int.from_bytes(iCer[2:sep], "big") % N
             # reject RU not in Z_N^* (must be invertible)
-            if GCD(RU, N) != 1:
+            if not unsafe_skip_validation and GCD(RU, N) != 1:
                 return None
-            return RU, identity
+            return RU, iCer[id_at:]
         except Exception:
             return None
 
@@ -154,6 +194,29 @@ def make_keygen_gq(N: int, e_rsa: int) -> Callable[[int], int]:
     return keygen
 
 
+def make_keygen_gq_crt(p: int, q: int, e_rsa: int) -> Callable[[int], int]:
+    """
+    KeyGen(s) = s^{-e_RSA} mod N computed with the factorization N = p*q:
+    two half-size modexps (exponents reduced mod p-1, q-1) recombined by
+    Garner's formula. Same output as make_keygen_gq(p*q, e_rsa).
+    """
+    N = p * q
+    dp = e_rsa % (p - 1)
+    dq = e_rsa % (q - 1)
+    q_inv = pow(q, -1, p)
+
+    def keygen(s: int) -> int:
+        sp = s % p
+        sq = s % q
+        if sp == 0 or sq == 0:
+            raise ValueError("Secret key not in Z_N^*")
+        xp = pow(sp, -dp, p)  # (s^{-1})^{e} mod p
+        xq = pow(sq, -dq, q)
+        h = (q_inv * (xp - xq)) % p
+        return (xq + h * q) % N
+    return keygen
+
+
 # ----------------------------
 # Sampler for secret keys in Z_N^*
 # ----------------------------
@@ -175,10 +238,23 @@ def make_gq_params(
     N: int,
     e_rsa: int = 65537,
     lam: int = 128,
+    factors: Optional[Tuple[int, int]] = None,
+    unsafe_skip_validation: bool = False,
 ) -> tuple[Params[int, int], Callable[[], int]]:
+    """
+    factors: optional (p, q) with p*q == N. When given (the CA/benchmark
+    knows them), KeyGen uses the CRT path; PKRecon never needs them.
+    unsafe_skip_validation: see make_encode_decode_for_modulus.
+    """
     ops = ZStarOps(N=N)
-    encode, decode = make_encode_decode_for_modulus(N)
-    keygen = make_keygen_gq(N, e_rsa)
+    encode, decode = make_encode_decode_for_modulus(N, unsafe_skip_validation)
+    if factors is not None:
+        p, q = factors
+        if p * q != N:
+            raise ValueError("factors do not multiply to N")
+        keygen = make_keygen_gq_crt(p, q, e_rsa)
+    else:
+        keygen = make_keygen_gq(N, e_rsa)
 
     params = Params(
         keygen=keygen,
@@ -186,7 +262,7 @@ def make_gq_params(
         E_ops=ops,
         Encode=encode,
         Decode=decode,
-        RO=lambda cer: ro_default(cer, lam=lam),
+        RO=make_ro(lam),
     )
     sample_H = make_sampler_zstar(N)
     return params, sample_H
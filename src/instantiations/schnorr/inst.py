@@ -2,23 +2,31 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from types import SimpleNamespace
 from typing import Callable, Optional, Tuple
 
+import operator
 import secrets
 
 from gic.core import Params
-from gic.ro import ro_default
+from gic.ro import make_ro
 
 # Pure-Python P-256 ops via `ecdsa`
 try:
     from ecdsa.curves import NIST256p
-    from ecdsa.ellipticcurve import INFINITY, Point
-    from ecdsa.numbertheory import square_root_mod_prime
+    from ecdsa.ellipticcurve import INFINITY, Point, PointJacobi
 except Exception as e:  # pragma: no cover
     raise ImportError(
         "Schnorr instantiation requires the 'ecdsa' package. Install via: pip install ecdsa"
     ) from e
 
+# Optional: OpenSSL fixed-base s*G via `cryptography` for KeyGen. It exposes no
+# point addition or variable-base multiplication, so group ops stay on ecdsa.
+try:
+    from cryptography.hazmat.primitives.asymmetric import ec as _ec
+except ImportError:  # pragma: no cover
+    _ec = None
+
 
 # ----------------------------
 # H: Z_q as an additive group
@@ -26,10 +34,14 @@ except Exception as e:  # pragma: no cover
 # Here: mul ≡ add, inv ≡ neg.
 # ----------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ZqOps:
     q: int
 
+    @property
+    def order(self) -> int:
+        return self.q
+
     def zero(self) -> int:
         return 0
 
@@ -44,80 +56,126 @@ class ZqOps:
         return (-a) % self.q
 
     # aliases expected by core naming
-    def mul(self, a: int, b: int) -> int:
-        return self.add(a, b)
+    mul = add
+    inv = neg
+
+    # a ⊙ x = a*x mod q
+    def scalar_mul(self, a: int, x: int) -> int:
+        return (a * x) % self.q
+
+    def as_funcs(self) -> SimpleNamespace:
+        """
+        Same ops as plain functions with q bound as a default argument: no
+        bound-method creation or self.q lookup per call.
+        """
+        q = self.q
+
+        def add(a: int, b: int, _q: int = q) -> int:
+            return (a + b) % _q
+
+        def neg(a: int, _q: int = q) -> int:
+            return (-a) % _q
 
-    def inv(self, a: int) -> int:
-        return self.neg(a)
+        def scalar_mul(a: int, x: int, _q: int = q) -> int:
+            return (a * x) % _q
 
+        def zero() -> int:
+            return 0
+
+        return SimpleNamespace(
+            q=q, order=q, zero=zero, one=zero, add=add, neg=neg, mul=add, inv=neg, scalar_mul=scalar_mul
+        )
 
 
 # ----------------------------
 # E: P-256 EC group as an additive group
 # Core expects E_ops.mul/inv (group law), so we alias:
 #   mul ≡ add, inv ≡ neg.
+# The group law lives in free functions (no instance state); P256Ops exposes
+# them as static methods and as_funcs() as a plain namespace.
 # ----------------------------
 
-@dataclass(frozen=True)
-class P256Ops:
-    curve = NIST256p.curve
-    gen = NIST256p.generator
-    q = NIST256p.order
-    p = NIST256p.curve.p()
-    a = NIST256p.curve.a()
-    b = NIST256p.curve.b()
+def _p256_identity():
+    return INFINITY
 
-    def zero(self):
-        return INFINITY
 
-    def one(self):
-        # core's z_action_E uses ops.one() as identity
+def _p256_neg(A, _curve=NIST256p.curve, _p=NIST256p.curve.p(), _q=NIST256p.order):
+    # -(x, y) = (x, -y): no need to re-validate the point as Point() would
+    if A is INFINITY:
         return INFINITY
+    if isinstance(A, PointJacobi):
+        return -A
+    return PointJacobi(_curve, A.x(), (-A.y()) % _p, 1, _q)
 
-    def add(self, A, B):
-        return A + B
-
-    def neg(self, A):
-        if A == INFINITY:
-            return INFINITY
-        return Point(self.curve, A.x(), (-A.y()) % self.p, A.order())
 
-    # aliases expected by core naming
-    def mul(self, A, B):
-        return self.add(A, B)
+def _p256_scalar_mul(k: int, A, _q=NIST256p.order):
+    k %= _q  # also folds k < 0 into [0, q): no neg + recursion
+    if k == 0 or A is INFINITY:
+        return INFINITY
+    P = _wnaf_mul(k, A)
+    if P is None:
+        # degenerate addition inside the ladder: defer to ecdsa
+        if isinstance(A, Point):
+            A = PointJacobi.from_affine(A)
+        P = A * k
+    return P
 
-    def inv(self, A):
-        return self.neg(A)
 
-    def scalar_mul(self, k: int, A):
-        k = int(k)
-        if A == INFINITY or k == 0:
-            return INFINITY
-        if k < 0:
-            return self.scalar_mul(-k, self.neg(A))
-        return k * A
+@dataclass(frozen=True)
+class P256Ops:
+    curve = NIST256p.curve
+    gen = NIST256p.generator  # ecdsa already builds it with generator=True (precomputed 2^i G)
+    q = NIST256p.order
+    order = NIST256p.order
+    p = NIST256p.curve.p()
+    a = NIST256p.curve.a()
+    b = NIST256p.curve.b()
 
+    # core's z_action_E uses ops.one() as identity
+    zero = one = staticmethod(_p256_identity)
+    # A + B: ecdsa's own point addition, no Python frame in between
+    add = mul = staticmethod(operator.add)
+    neg = inv = staticmethod(_p256_neg)
+    scalar_mul = staticmethod(_p256_scalar_mul)
+
+    @classmethod
+    def as_funcs(cls) -> SimpleNamespace:
+        """
+        Same ops as a plain namespace: E_ops.add(...) resolves straight to the
+        function, without going through the class and staticmethod descriptors.
+        """
+        return SimpleNamespace(
+            q=cls.q,
+            order=cls.order,
+            zero=_p256_identity,
+            one=_p256_identity,
+            add=operator.add,
+            mul=operator.add,
+            neg=_p256_neg,
+            inv=_p256_neg,
+            scalar_mul=_p256_scalar_mul,
+        )
 
 
 # ----------------------------
 # SEC1 compressed encoding for P-256 points (33 bytes)
 # ----------------------------
 
-def _int_to_fixed_bytes(x: int, length: int) -> bytes:
-    return x.to_bytes(length, "big")
-
-
-def _int_from_fixed_bytes(b: bytes) -> int:
-    return int.from_bytes(b, "big")
+# SEC1 prefix byte, indexed by the parity of y
+_COMPRESSED_PREFIX = (b"\x02", b"\x03")
 
 
 def _point_to_bytes_compressed(P) -> bytes:
     if P == INFINITY:
         raise ValueError("cannot encode point at infinity")
-    x = P.x()
-    y = P.y()
-    prefix = 0x03 if (y & 1) else 0x02
-    return bytes([prefix]) + _int_to_fixed_bytes(x, 32)
+    if isinstance(P, PointJacobi):
+        # one field inversion here, instead of one in each of x() and y()
+        P = P.to_affine()
+    return _COMPRESSED_PREFIX[P.y() & 1] + P.x().to_bytes(32, "big")
+
+
+# p ≡ 3 (mod 4) for P-256, so a square root of r (if any) is r^((p+1)/4).
+_SQRT_EXP = (P256Ops.p + 1) // 4
 
 
 def _point_from_bytes_compressed(buf: bytes) -> Optional[Point]:
@@ -126,7 +184,7 @@ def _point_from_bytes_compressed(buf: bytes) -> Optional[Point]:
     prefix = buf[0]
     if prefix not in (0x02, 0x03):
         return None
-    x = _int_from_fixed_bytes(buf[1:])
+    x = int.from_bytes(buf[1:], "big")
     p = P256Ops.p
     a = P256Ops.a
     b = P256Ops.b
@@ -134,23 +192,19 @@ def _point_from_bytes_compressed(buf: bytes) -> Optional[Point]:
         return None
 
     rhs = (pow(x, 3, p) + (a * x) % p + b) % p
-    try:
-        y = square_root_mod_prime(rhs, p)
-    except Exception:
-        return None
+    y = pow(rhs, _SQRT_EXP, p)
+    if (y * y) % p != rhs:
+        return None  # x is not the abscissa of a curve point
 
     if (y & 1) != (prefix & 1):
         y = (-y) % p
 
+    # A point with finite (x, y) is never INFINITY: no identity check needed.
     try:
-        P = Point(P256Ops.curve, x, y, P256Ops.q)
+        return Point(P256Ops.curve, x, y, P256Ops.q)
     except Exception:
         return None
 
-    if P == INFINITY:
-        return None
-    return P
-
 
 # ----------------------------
 # Encode/Decode for iCer = Encode(R_U, id)
@@ -161,45 +215,212 @@ def make_encode_decode_p256() -> tuple[
     Callable[[bytes], Optional[Tuple[Point, bytes]]],
 ]:
     RU_LEN = 33
+    sep = 2 + RU_LEN  # SEC1-compressed R_U has one size, so no length field
+    id_at = sep + 4
 
     def encode(RU: Point, identity: bytes) -> bytes:
-        return b"R=" + _point_to_bytes_compressed(RU) + b"|id=" + identity
+        return b"".join((b"R=", _point_to_bytes_compressed(RU), b"|id=", identity))
 
     def decode(iCer: bytes) -> Optional[Tuple[Point, bytes]]:
         try:
-            if not iCer.startswith(b"R="):
-                return None
-            rest = iCer[2:]
-            if len(rest) < RU_LEN + 4:
+            if len(iCer) < id_at or iCer[:2] != b"R=" or iCer[sep:id_at] != b"|id=":
                 return None
-            RU_bytes = rest[:RU_LEN]
-            tail = rest[RU_LEN:]
-            if not tail.startswith(b"|id="):
-                return None
-            identity = tail[4:]
-            RU = _point_from_bytes_compressed(RU_bytes)
+            RU = _point_from_bytes_compressed(iCer[2:sep])
             if RU is None:
                 return None
-            return RU, identity
+            return RU, iCer[id_at:]
         except Exception:
             return None
 
     return encode, decode
 
 
+# ----------------------------
+# Fixed-base comb for s * G (pure-Python KeyGen path)
+# TABLE[w][i] = i * 16^w * G (affine), so s * G is one mixed Jacobian+affine
+# addition per nonzero 4-bit digit of s: <= 64 additions and no doublings.
+# Built once (~1k points) by the first make_keygen_p256 that needs it.
+# ----------------------------
+
+_COMB_BITS = 4
+_COMB_TABLE: Optional[list] = None
+
+
+def _madd(X1: int, Y1: int, Z1: int, x2: int, y2: int, p: int):
+    """Jacobian (X1, Y1, Z1) + affine (x2, y2), EFD madd-2004-hmv; None if the points are equal or opposite."""
+    Z1Z1 = Z1 * Z1 % p
+    H = (x2 * Z1Z1 - X1) % p
+    r = (y2 * Z1 * Z1Z1 - Y1) % p
+    if H == 0:
+        return None
+    HH = H * H % p
+    HHH = H * HH % p
+    V = X1 * HH % p
+    X3 = (r * r - HHH - 2 * V) % p
+    return X3, (r * (V - X3) - Y1 * HHH) % p, Z1 * H % p
+
+
+def _batch_to_affine(points: list, p: int) -> list:
+    """Normalize Jacobian (X, Y, Z) points with one inversion (Montgomery's trick)."""
+    prefix = []
+    acc = 1
+    for _, _, Z in points:
+        prefix.append(acc)
+        acc = acc * Z % p
+    inv = pow(acc, -1, p)  # 1 / (Z_0 ... Z_{n-1})
+    out = [None] * len(points)
+    for i in range(len(points) - 1, -1, -1):
+        X, Y, Z = points[i]
+        z_inv = inv * prefix[i] % p
+        inv = inv * Z % p
+        z_inv2 = z_inv * z_inv % p
+        out[i] = (X * z_inv2 % p, Y * z_inv2 * z_inv % p)
+    return out
+
+
+def _jdbl(X1: int, Y1: int, Z1: int, p: int):
+    """Jacobian doubling for a = -3 (dbl-2001-b)."""
+    delta = Z1 * Z1 % p
+    gamma = Y1 * Y1 % p
+    beta = X1 * gamma % p
+    alpha = 3 * (X1 - delta) * (X1 + delta) % p
+    X3 = (alpha * alpha - 8 * beta) % p
+    Z3 = ((Y1 + Z1) * (Y1 + Z1) - gamma - delta) % p
+    return X3, (alpha * (4 * beta - X3) - 8 * gamma * gamma) % p, Z3
+
+
+# ----------------------------
+# Variable-base k * A: width-w NAF over Jacobian coordinates
+# Odd multiples A, 3A, ..., (2^(w-1) - 1)A are built in Jacobian form and
+# normalized with one inversion, so every ladder addition is a mixed add.
+# ----------------------------
+
+_WNAF_BITS = 5
+
+
+def _wnaf(k: int) -> list:
+    """Width-w NAF digits of k > 0, least significant first."""
+    digits = []
+    full = 1 << _WNAF_BITS
+    half = full >> 1
+    while k:
+        if k & 1:
+            d = k & (full - 1)
+            if d >= half:
+                d -= full
+            k -= d
+        else:
+            d = 0
+        digits.append(d)
+        k >>= 1
+    return digits
+
+
+def _wnaf_mul(k: int, A):
+    """k * A for k > 0 and A != INFINITY; None on a degenerate addition."""
+    p = P256Ops.p
+    if isinstance(A, PointJacobi):
+        A = A.to_affine()
+        if A is INFINITY:
+            return INFINITY
+    x, y = A.x(), A.y()
+    D = PointJacobi(P256Ops.curve, x, y, 1, P256Ops.q).double().to_affine()
+    dx, dy = D.x(), D.y()
+    jac = [(x, y, 1)]
+    for _ in range((1 << (_WNAF_BITS - 2)) - 1):
+        jac.append(_madd(*jac[-1], dx, dy, p))
+    odd = _batch_to_affine(jac, p)
+
+    acc = None
+    for d in reversed(_wnaf(k)):
+        if acc is not None:
+            acc = _jdbl(*acc, p)
+        if d:
+            tx, ty = odd[abs(d) >> 1]
+            if d < 0:
+                ty = p - ty
+            if acc is None:
+                acc = (tx, ty, 1)
+            else:
+                acc = _madd(*acc, tx, ty, p)
+                if acc is None:
+                    return None
+    return PointJacobi(P256Ops.curve, *acc, P256Ops.q)
+
+
+def _comb_table() -> list:
+    global _COMB_TABLE
+    if _COMB_TABLE is None:
+        p = P256Ops.p
+        n = 1 << _COMB_BITS
+        table = []
+        G = P256Ops.gen
+        x, y = G.x(), G.y()
+        for _ in range((P256Ops.q.bit_length() + _COMB_BITS - 1) // _COMB_BITS):
+            # 1*B .. 16*B in Jacobian form, then one shared inversion per row
+            D = PointJacobi(P256Ops.curve, x, y, 1, P256Ops.q).double().to_affine()
+            jac = [(x, y, 1), (D.x(), D.y(), 1)]
+            for _ in range(3, n + 1):
+                jac.append(_madd(*jac[-1], x, y, p))
+            aff = _batch_to_affine(jac, p)
+            table.append([None] + aff[: n - 1])
+            x, y = aff[n - 1]  # 16 * B
+        _COMB_TABLE = table
+    return _COMB_TABLE
+
+
+def _comb_mul_base(s: int):
+    """s * G for 0 < s < q via the comb table; None on a degenerate addition."""
+    table = _comb_table()
+    p = P256Ops.p
+    acc = None
+    w = 0
+    while s:
+        d = s & ((1 << _COMB_BITS) - 1)
+        if d:
+            x2, y2 = table[w][d]
+            if acc is None:
+                acc = (x2, y2, 1)
+            else:
+                acc = _madd(*acc, x2, y2, p)
+                if acc is None:
+                    return None  # acc == ±entry: not reachable for random s
+        s >>= _COMB_BITS
+        w += 1
+    return PointJacobi(P256Ops.curve, *acc, P256Ops.q)
+
+
 # ----------------------------
 # KeyGen(s) = s * G  (Schnorr-type)
 # ----------------------------
 
-def make_keygen_p256() -> Callable[[int], Point]:
+def make_keygen_p256() -> Callable[[int], PointJacobi]:
     G = P256Ops.gen
     q = P256Ops.q
+    curve = P256Ops.curve
+
+    if _ec is not None:
+        secp256r1 = _ec.SECP256R1()
+
+        def keygen(s: int) -> PointJacobi:
+            s = int(s) % q
+            if s == 0:
+                raise ValueError("Secret key must be nonzero in Z_q")
+            # OpenSSL computes s*G; wrap the affine result as an ecdsa point
+            # (z = 1) so it interoperates with P256Ops and compares equal.
+            nums = _ec.derive_private_key(s, secp256r1).public_key().public_numbers()
+            return PointJacobi(curve, nums.x, nums.y, 1, q)
+
+        return keygen
+
+    _comb_table()  # build now, so the first (timed) KeyGen does not pay for it
 
-    def keygen(s: int) -> Point:
+    def keygen(s: int) -> PointJacobi:
         s = int(s) % q
         if s == 0:
             raise ValueError("Secret key must be nonzero in Z_q")
-        return s * G
+        P = _comb_mul_base(s)
+        return P if P is not None else s * G
 
     return keygen
 
@@ -210,10 +431,10 @@ def make_sampler_zq(q: int) -> Callable[[], int]:
     return sample
 
 
-def make_schnorr_params(lam: int = 128) -> tuple[Params[int, Point], Callable[[], int]]:
+def make_schnorr_params(lam: int = 128) -> tuple[Params[int, PointJacobi], Callable[[], int]]:
     q = P256Ops.q
-    H_ops = ZqOps(q=q)
-    E_ops = P256Ops()
+    H_ops = ZqOps(q=q).as_funcs()
+    E_ops = P256Ops.as_funcs()
     encode, decode = make_encode_decode_p256()
     keygen = make_keygen_p256()
 
@@ -223,7 +444,7 @@ def make_schnorr_params(lam: int = 128) -> tuple[Params[int, Point], Callable[[]
         E_ops=E_ops,
         Encode=encode,
         Decode=decode,
-        RO=lambda cer: ro_default(cer, lam=lam),
+        RO=make_ro(lam),
     )
     sample_H = make_sampler_zq(q)
     return params, sample_H
@@ -1,8 +1,38 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parent.parent
 SRC = ROOT / "src"
+BENCH = ROOT / "bench"
+
+for path in (SRC, BENCH):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+
+@pytest.fixture(scope="session")
+def rsa_primes_512(pytestconfig):
+    """A 512-bit RSA prime pair (p, q), persisted in the pytest cache across runs.
+
+    Falls back to generating once per session when the cache plugin is disabled
+    (-p no:cacheprovider).
+    """
+    from instantiations.gq import gen_rsa_primes
+
+    key = "gic/rsa_primes_512"
+    cache = getattr(pytestconfig, "cache", None)
+    cached = cache.get(key, None) if cache is not None else None
+    if cached is not None and len(cached) == 2 and (cached[0] * cached[1]).bit_length() == 512:
+        return tuple(cached)
+    p, q = gen_rsa_primes(bits=512)
+    if cache is not None:
+        cache.set(key, [p, q])
+    return p, q
+
 
-if str(SRC) not in sys.path:
-    sys.path.insert(0, str(SRC))
+@pytest.fixture(scope="session")
+def rsa_modulus_512(rsa_primes_512):
+    p, q = rsa_primes_512
+    return p * q
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import pickle
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+import aggregate  # noqa: E402  (bench/ is on sys.path via conftest)
+
+BENCH = Path(__file__).resolve().parent.parent / "bench"
+OUTPUTS = BENCH / "outputs"
+
+# Warmup rows, Setup rows with no iCert, an even-n median, a zero length
+# among non-zero ones and two groups sorted out of input order.
+RAW = """\
+scheme,bits,lam,op,warmup,rep,elapsed_ns,icert_len_bytes,pk_len_bytes,sk_len_bytes
+toy,512,16,Setup,1,0,999999,0,8,8
+toy,512,16,Setup,0,0,120,0,8,8
+toy,512,16,Setup,0,1,100,0,8,8
+toy,512,16,iCertGen,1,0,888888,12,8,8
+toy,512,16,iCertGen,0,0,310,12,8,8
+toy,512,16,iCertGen,0,1,305,11,8,8
+toy,512,16,iCertGen,0,2,340,12,8,8
+toy,512,16,iCertGen,0,3,301,12,8,8
+toy,512,16,iCertGen,0,4,999,12,8,8
+alt,256,8,PKRecon,0,0,7,20,4,2
+alt,256,8,PKRecon,0,1,5,20,4,2
+alt,256,8,PKRecon,0,2,6,0,4,2
+"""
+
+# Byte-exact output of the original csv-module aggregate.py on RAW.
+HEADER = "scheme,bits,lam,op,n,mean_ns,median_ns,p95_ns,p99_ns,min_ns,max_ns,icert_len_bytes,pk_len_bytes,sk_len_bytes"
+EXPECTED = {
+    False: [
+        HEADER,
+        "alt,256,8,PKRecon,3,6,6,7,7,5,7,20,4,2",
+        "toy,512,16,Setup,2,110,110,120,120,100,120,0,8,8",
+        "toy,512,16,iCertGen,5,451,310,999,999,301,999,11,8,8",
+    ],
+    True: [
+        HEADER,
+        "alt,256,8,PKRecon,3,6,6,7,7,5,7,20,4,2",
+        "toy,512,16,Setup,3,333406,120,999999,999999,100,999999,0,8,8",
+        "toy,512,16,iCertGen,6,148524,325,888888,888888,301,888888,11,8,8",
+    ],
+}
+
+
+def _aggregate(inputs, out: Path, *extra: str) -> bytes:
+    subprocess.run(
+        [sys.executable, str(BENCH / "aggregate.py"), "--in", *map(str, inputs), "--out", str(out), *extra],
+        check=True,
+        capture_output=True,
+    )
+    return out.read_bytes()
+
+
+@pytest.mark.parametrize("include_warmup", [False, True])
+def test_aggregate_matches_baseline_output(tmp_path, include_warmup):
+    raw = tmp_path / "raw.csv"
+    raw.write_text(RAW)
+    extra = ("--include-warmup",) if include_warmup else ()
+    got = _aggregate([raw], tmp_path / "summary.csv", "--no-cache", "--jobs", "1", *extra)
+    assert got == "".join(line + "\r\n" for line in EXPECTED[include_warmup]).encode()
+
+
+def test_aggregate_reproduces_committed_summary(tmp_path):
+    inputs = [OUTPUTS / f"{s}_sec128_v2.csv" for s in ("bls", "gq", "schnorr")]
+    got = _aggregate(inputs, tmp_path / "summary.csv", "--no-cache")
+    # The committed summary was saved with LF line endings
+    assert got.replace(b"\r\n", b"\n") == (OUTPUTS / "summary_all_sec128_v2.csv").read_bytes()
+
+
+def test_load_one_cache_hit_and_unreadable_cache_fallback(tmp_path):
+    raw = tmp_path / "raw.csv"
+    raw.write_text(RAW)
+    expected = aggregate._load_one(str(raw), use_cache=False)
+
+    first = aggregate._load_one(str(raw))
+    cache = Path(str(raw) + aggregate.CACHE_SUFFIX)
+    assert cache.exists()
+    pd.testing.assert_frame_equal(first, expected)
+    pd.testing.assert_frame_equal(aggregate._load_one(str(raw)), expected)
+
+    # A pickle referring to something that no longer exists (as after a
+    # pandas upgrade) raises AttributeError on load; it must re-parse.
+    cache.write_bytes(b"cbuiltins\nno_such_attribute\n.")
+    with pytest.raises(AttributeError):
+        pickle.loads(cache.read_bytes())
+    pd.testing.assert_frame_equal(aggregate._load_one(str(raw)), expected)
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from gic.codec import decode_simple_int, encode_simple
+
+
+def test_encode_simple_roundtrip():
+    for R in (0, 1, -1, 127, 128, -129, 65536, 2**3071 + 12345, -(2**200)):
+        for identity in (b"", b"alice", b"x|id=y"):
+            assert decode_simple_int(encode_simple(R, identity)) == (R, identity)
+
+
+def test_decode_simple_int_rejects_malformed():
+    good = encode_simple(4242, b"alice")
+    for bad in (b"", b"not-an-icert", b"R=", good[:-6], good.replace(b"|id=", b"|ix="), b"X" + good[1:]):
+        assert decode_simple_int(bad) is None
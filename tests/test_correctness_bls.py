@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import pytest
+
 from gic.core import PKRecon, SKGen, Setup, iCertGen
 from instantiations.bls import make_bls_params
 
 
-def test_bls_correctness_end_to_end():
+@pytest.fixture(scope="module")
+def setup():
     params, sample_H = make_bls_params(lam=128)
     sk_C, pk_C = Setup(params, sample_H)
+    return params, sample_H, sk_C, pk_C
+
+
+def test_bls_correctness_end_to_end(setup):
+    params, sample_H, sk_C, pk_C = setup
 
     identity = b"alice"
     (iCer, _), (_, view_U) = iCertGen(params, identity, sk_C, sample_H)
@@ -18,8 +26,78 @@ def test_bls_correctness_end_to_end():
     assert params.keygen(sk_U) == pk_U
 
 
-def test_bls_pkrecon_rejects_malformed():
+def test_bls_pkrecon_rejects_malformed(setup):
+    params, _sample_H, _sk_C, pk_C = setup
+
+    assert PKRecon(params, b"garbage", pk_C) is None
+
+
+def test_bls_skip_validation_decodes_same_point(setup):
+    params, sample_H, sk_C, pk_C = setup
+    fast, _ = make_bls_params(lam=128, unsafe_skip_validation=True)
+    (iCer, _), _ = iCertGen(params, b"alice", sk_C, sample_H)
+
+    assert fast.Decode(iCer) == params.Decode(iCer)
+    assert PKRecon(fast, iCer, pk_C) == PKRecon(params, iCer, pk_C)
+    assert PKRecon(fast, b"garbage", pk_C) is None
+
+
+def test_bls_blspy_backend_matches_pyecc():
+    pytest.importorskip("blspy")
     params, sample_H = make_bls_params(lam=128)
-    _sk_C, pk_C = Setup(params, sample_H)
+    fast, _ = make_bls_params(lam=128, backend="blspy")
+
+    sk_C, pk_C = Setup(fast, sample_H)
+    (iCer, _), (_, view_U) = iCertGen(fast, b"alice", sk_C, sample_H)
+    sk_U = SKGen(fast, view_U, iCer)
+    pk_U = PKRecon(fast, iCer, pk_C)
+
+    assert pk_U is not None
+    assert fast.keygen(sk_U) == pk_U
+    # Same group and encoding: the py_ecc instantiation agrees on the iCer.
+    assert params.Encode(params.keygen(sk_U), b"x") == fast.Encode(pk_U, b"x")
+    assert params.Encode(PKRecon(params, iCer, params.keygen(sk_C)), b"x") == fast.Encode(pk_U, b"x")
+    assert PKRecon(fast, b"garbage", pk_C) is None
+
+
+def test_bls_blspy_correctness_end_to_end():
+    pytest.importorskip("blspy")
+    from instantiations.bls.inst_blspy import make_bls_params_blspy
 
+    params, sample_H = make_bls_params_blspy(lam=128)
+    sk_C, pk_C = Setup(params, sample_H)
+
+    identity = b"alice"
+    (iCer, _), (_, view_U) = iCertGen(params, identity, sk_C, sample_H)
+
+    sk_U = SKGen(params, view_U, iCer)
+    pk_U = PKRecon(params, iCer, pk_C)
+
+    assert pk_U is not None
+    assert params.keygen(sk_U) == pk_U
+    assert params.Decode(params.Encode(pk_U, identity)) == (pk_U, identity)
     assert PKRecon(params, b"garbage", pk_C) is None
+
+
+def test_bls_g1_scalars_not_reduced_for_points_outside_subgroup():
+    from py_ecc.optimized_bls12_381 import FQ, curve_order, eq, field_modulus, is_inf, multiply
+
+    from gic.core import z_action_E
+    from instantiations.bls.inst import G1Ops
+
+    # Smallest x with a curve point: y^2 = x^3 + 4 has cofactor h > 1, so
+    # this point is (overwhelmingly) outside the order-r subgroup G1.
+    p = field_modulus
+    x = 1
+    while pow(x**3 + 4, (p - 1) // 2, p) != 1:
+        x += 1
+    P = (FQ(x), FQ(pow(x**3 + 4, (p + 1) // 4, p)), FQ(1))
+    assert not is_inf(multiply(P, curve_order))
+
+    # Decode accepts it (on-curve only), so core must not reduce e mod r.
+    params, _ = make_bls_params(lam=128)
+    assert params.Decode(params.Encode(P, b"x")) is not None
+    assert getattr(G1Ops(), "order", None) is None
+    e = curve_order + 5
+    assert eq(z_action_E(G1Ops(), e, P), multiply(P, e))
+    assert not eq(z_action_E(G1Ops(), e, P), multiply(P, 5))
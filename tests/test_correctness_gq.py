@@ -1,15 +1,22 @@
 from __future__ import annotations
 
+import pytest
+
 from gic.core import PKRecon, SKGen, Setup, iCertGen
-from instantiations.gq import gen_rsa_modulus, make_gq_params
+from instantiations.gq import make_gq_params
+from instantiations.gq.inst import _is_probable_prime
 
 
-def test_gq_correctness_end_to_end():
+@pytest.fixture(scope="module")
+def setup(rsa_modulus_512):
     # Keep modulus small for unit tests (fast). Benchmarks will use 2048+ bits.
-    N = gen_rsa_modulus(bits=512)
-    params, sample_H = make_gq_params(N=N, e_rsa=65537, lam=16)
-
+    params, sample_H = make_gq_params(N=rsa_modulus_512, e_rsa=65537, lam=16)
     sk_C, pk_C = Setup(params, sample_H)
+    return params, sample_H, sk_C, pk_C
+
+
+def test_gq_correctness_end_to_end(setup):
+    params, sample_H, sk_C, pk_C = setup
 
     identity = b"alice"
     (iCer, view_CA), (_iCer2, view_U) = iCertGen(params, identity, sk_C, sample_H)
@@ -21,9 +28,50 @@ def test_gq_correctness_end_to_end():
     assert params.keygen(sk_U) == pk_U
 
 
-def test_gq_pkrecon_rejects_malformed():
-    N = gen_rsa_modulus(bits=512)
+def test_gq_pkrecon_rejects_malformed(setup):
+    params, _sample_H, _sk_C, pk_C = setup
+
+    assert PKRecon(params, b"garbage", pk_C) is None
+
+
+def test_gq_crt_keygen_matches_plain(rsa_primes_512):
+    p, q = rsa_primes_512
+    N = p * q
     params, sample_H = make_gq_params(N=N, e_rsa=65537, lam=16)
+    params_crt, _ = make_gq_params(N=N, e_rsa=65537, lam=16, factors=(p, q))
+
+    for _ in range(5):
+        s = sample_H()
+        assert params_crt.keygen(s) == params.keygen(s)
+
+    sk_C, pk_C = Setup(params_crt, sample_H)
+    (iCer, _), (_, view_U) = iCertGen(params_crt, b"alice", sk_C, sample_H)
+    sk_U = SKGen(params_crt, view_U, iCer)
+    assert params.keygen(sk_U) == PKRecon(params, iCer, pk_C)
+
+
+def test_gq_skip_validation_only_drops_gcd_check(rsa_primes_512):
+    p, q = rsa_primes_512
+    N = p * q
+    params, sample_H = make_gq_params(N=N, e_rsa=65537, lam=16)
+    fast, _ = make_gq_params(N=N, e_rsa=65537, lam=16, unsafe_skip_validation=True)
     sk_C, pk_C = Setup(params, sample_H)
+    (iCer, _), _ = iCertGen(params, b"alice", sk_C, sample_H)
 
-    assert PKRecon(params, b"garbage", pk_C) is None
+    assert PKRecon(fast, iCer, pk_C) == PKRecon(params, iCer, pk_C)
+
+    bad = fast.Encode(p, b"alice")  # p is not in Z_N^*
+    assert params.Decode(bad) is None
+    assert fast.Decode(bad) == (p, b"alice")
+
+
+def test_is_probable_prime_small_and_carmichael():
+    def naive(n):
+        return n >= 2 and all(n % d for d in range(2, int(n ** 0.5) + 1))
+
+    assert [n for n in range(5000) if _is_probable_prime(n)] == [n for n in range(5000) if naive(n)]
+    # Carmichael numbers, a semiprime above the trial-division bound, and the
+    # smallest strong pseudoprime to bases 2..37 (inside the deterministic range)
+    for n in (561, 41041, 825265, 321197185, 1009 * 1013, 318665857834031151167461):
+        assert not _is_probable_prime(n)
+    assert _is_probable_prime(2 ** 127 - 1)
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import pytest
+
 from gic.core import PKRecon, SKGen, Setup, iCertGen
 from instantiations.schnorr import make_schnorr_params
 
 
-def test_schnorr_correctness_end_to_end():
+@pytest.fixture(scope="module")
+def setup():
     params, sample_H = make_schnorr_params(lam=128)
-
     sk_C, pk_C = Setup(params, sample_H)
+    return params, sample_H, sk_C, pk_C
+
+
+def test_schnorr_correctness_end_to_end(setup):
+    params, sample_H, sk_C, pk_C = setup
 
     identity = b"alice"
     (iCer, _view_CA), (_iCer2, view_U) = iCertGen(params, identity, sk_C, sample_H)
@@ -19,8 +26,124 @@ def test_schnorr_correctness_end_to_end():
     assert params.keygen(sk_U) == pk_U
 
 
-def test_schnorr_pkrecon_rejects_malformed():
-    params, sample_H = make_schnorr_params(lam=128)
-    _sk_C, pk_C = Setup(params, sample_H)
+def test_schnorr_pkrecon_rejects_malformed(setup):
+    params, _sample_H, _sk_C, pk_C = setup
 
     assert PKRecon(params, b"garbage", pk_C) is None
+
+
+@pytest.mark.parametrize("path", ["openssl", "comb", "ecdsa"])
+def test_schnorr_keygen_matches_generator_multiple(setup, monkeypatch, path):
+    from ecdsa.curves import NIST256p
+
+    from instantiations.schnorr import inst
+
+    # Force each KeyGen branch explicitly: OpenSSL when cryptography imports,
+    # else the comb table, else ecdsa's s * G (the comb's degenerate fallback).
+    if path == "openssl":
+        pytest.importorskip("cryptography")
+        assert inst._ec is not None
+    else:
+        monkeypatch.setattr(inst, "_ec", None)
+        if path == "ecdsa":
+            monkeypatch.setattr(inst, "_comb_mul_base", lambda s: None)
+    keygen = inst.make_keygen_p256()
+
+    _params, sample_H, _sk_C, _pk_C = setup
+    for s in (1, 2, 15, 16, 17, 2**252 + 1, NIST256p.order - 1, sample_H(), sample_H()):
+        assert keygen(s) == s * NIST256p.generator
+    with pytest.raises(ValueError):
+        keygen(NIST256p.order)
+
+
+def test_schnorr_decode_rejects_x_off_curve(setup):
+    from instantiations.schnorr.inst import P256Ops
+
+    params, sample_H, _sk_C, _pk_C = setup
+    RU = params.keygen(sample_H())
+    iCer = params.Encode(RU, b"alice")
+    assert params.Decode(iCer) == (RU, b"alice")
+
+    # x = 1: 1 - 3 + b is a non-residue mod p, so no point has this abscissa
+    p = P256Ops.p
+    assert pow((1 - 3 + P256Ops.b) % p, (p - 1) // 2, p) != 1
+    bad = iCer[:3] + (1).to_bytes(32, "big") + iCer[35:]
+    assert params.Decode(bad) is None
+
+
+def test_schnorr_zq_as_funcs_matches_methods():
+    from instantiations.schnorr.inst import ZqOps
+
+    ops = ZqOps(q=101)
+    fns = ops.as_funcs()
+    assert fns.zero() == fns.one() == ops.zero() and fns.order == ops.order
+    for a in (0, 1, 57, 100, -3):
+        for b in (0, 1, 44, 100):
+            assert fns.add(a, b) == fns.mul(a, b) == ops.add(a, b)
+            assert fns.scalar_mul(a, b) == ops.scalar_mul(a, b)
+        assert fns.neg(a) == fns.inv(a) == ops.neg(a)
+
+
+def test_schnorr_neg_is_additive_inverse(setup):
+    from ecdsa.ellipticcurve import INFINITY, PointJacobi
+
+    params, sample_H, _sk_C, _pk_C = setup
+    ops = params.E_ops
+    P = params.keygen(sample_H())
+    for A in (P, P.to_affine(), PointJacobi.from_affine(P.to_affine()).double()):
+        assert ops.add(A, ops.neg(A)) == INFINITY
+        assert ops.neg(ops.neg(A)) == A
+    assert ops.neg(INFINITY) is INFINITY
+
+
+def test_schnorr_scalar_mul_matches_ecdsa(setup):
+    from ecdsa.ellipticcurve import PointJacobi
+
+    params, sample_H, _sk_C, _pk_C = setup
+    q = params.E_ops.order
+    A = params.keygen(sample_H())
+    for k in (1, 2, 3, 15, 16, 17, 31, 2**128 - 1, q - 1, sample_H()):
+        expected = PointJacobi.from_affine(A.to_affine()) * k
+        assert params.E_ops.scalar_mul(k, A) == expected
+        assert params.E_ops.scalar_mul(k, A.to_affine()) == expected
+        assert params.E_ops.scalar_mul(-k, A) == params.E_ops.neg(expected)
+    assert params.E_ops.scalar_mul(q, A) == params.E_ops.scalar_mul(0, A)
+
+
+def test_schnorr_p256_as_funcs_matches_methods(setup):
+    from ecdsa.ellipticcurve import INFINITY
+
+    from instantiations.schnorr.inst import P256Ops
+
+    params, sample_H, _sk_C, _pk_C = setup
+    ops, fns = P256Ops(), P256Ops.as_funcs()
+    A, B = params.keygen(sample_H()), params.keygen(sample_H())
+    assert fns.zero() is fns.one() is ops.zero() is INFINITY and fns.order == ops.order
+    assert fns.add(A, B) == fns.mul(A, B) == ops.add(A, B) == ops.mul(A, B)
+    assert fns.neg(A) == fns.inv(A) == ops.neg(A) == ops.inv(A)
+    assert fns.scalar_mul(12345, A) == ops.scalar_mul(12345, A)
+
+
+def test_schnorr_decode_checks_fixed_layout(setup):
+    params, sample_H, _sk_C, _pk_C = setup
+    RU = params.keygen(sample_H())
+    iCer = params.Encode(RU, b"")
+    assert len(iCer) == 39 and params.Decode(iCer) == (RU, b"")
+    assert params.Decode(iCer[:-1]) is None
+    assert params.Decode(b"X" + iCer[1:]) is None
+    assert params.Decode(iCer[:35] + b"|ID=" + b"bob") is None
+
+
+def test_schnorr_openssl_keygen_matches_comb_and_ecdsa(setup):
+    ec = pytest.importorskip("cryptography.hazmat.primitives.asymmetric.ec")
+    from ecdsa.curves import NIST256p
+
+    from instantiations.schnorr.inst import _comb_mul_base, make_keygen_p256
+
+    _params, sample_H, _sk_C, _pk_C = setup
+    keygen = make_keygen_p256()  # the OpenSSL path, since cryptography imports
+    for s in (1, 2, 17, 2**252 + 1, NIST256p.order - 1, sample_H(), sample_H()):
+        nums = ec.derive_private_key(s, ec.SECP256R1()).public_key().public_numbers()
+        comb = _comb_mul_base(s).to_affine()
+        assert (nums.x, nums.y) == (comb.x(), comb.y())
+        assert keygen(s) == s * NIST256p.generator
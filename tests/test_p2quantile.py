@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import pytest
+
+from p2quantile import P2Quantile
+
+
+def test_p2_tracks_numpy_quantile_on_fixed_sample():
+    np = pytest.importorskip("numpy")
+    # Right-skewed, like per-op latencies
+    xs = np.random.default_rng(12345).lognormal(mean=0.0, sigma=0.5, size=20000)
+    for q in (0.5, 0.95, 0.99):
+        est = P2Quantile(q)
+        for x in xs:
+            est.update(float(x))
+        assert est.count == len(xs)
+        assert est.value() == pytest.approx(np.quantile(xs, q), rel=0.01)
+
+
+def test_p2_fewer_than_five_observations_is_exact_nearest_rank():
+    values = [5.0, 1.0, 4.0, 2.0]
+    for q, expected in ((0.25, 1.0), (0.5, 2.0), (0.75, 4.0), (0.99, 5.0)):
+        est = P2Quantile(q)
+        for x in values:
+            est.update(x)
+        assert est.value() == expected
+
+    one = P2Quantile(0.5)
+    one.update(7.0)
+    assert one.value() == 7.0
+
+
+def test_p2_rejects_empty_and_bad_quantile():
+    with pytest.raises(ValueError):
+        P2Quantile(0.5).value()
+    for q in (0.0, 1.0, -0.1):
+        with pytest.raises(ValueError):
+            P2Quantile(q)
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from gic.ro import make_ro, ro_default
+
+
+def test_make_ro_matches_ro_default():
+    for lam in (8, 16, 128, 255, 256, 300):
+        ro = make_ro(lam)
+        for msg in (b"", b"alice", b"R=" + bytes(range(48)) + b"|id=bob"):
+            e = ro(msg)
+            assert e == ro_default(msg, lam=lam)
+            assert 1 <= e <= 2**lam
+
+
+def test_make_ro_domain_separation():
+    for lam in (128, 300):
+        ro, tagged = make_ro(lam), make_ro(lam, domain=b"GIC|")
+        for msg in (b"", b"alice"):
+            assert tagged(msg) == ro_default(msg, lam=lam, domain=b"GIC|")
+            assert tagged(msg) == ro(b"GIC|" + msg)
+            assert tagged(msg) != ro(msg)
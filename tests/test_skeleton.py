@@ -3,7 +3,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional, Tuple
 
-from gic.core import Params, PKRecon, SKGen, Setup, iCertGen
+import pytest
+
+from gic.core import Params, PKRecon, SKGen, Setup, iCertGen, z_action_E, z_action_H
 from gic.codec import decode_simple_int, encode_simple
 from gic.ro import ro_default
 
@@ -35,6 +37,28 @@ class EOps:
         return (-value) % Q
 
 
+@dataclass(frozen=True)
+class NativeHOps(HOps):
+    def scalar_mul(self, a: int, h: int) -> int:
+        return (a * h) % Q
+
+
+@dataclass(frozen=True)
+class NativeEOps(EOps):
+    def scalar_mul(self, a: int, X: int) -> int:
+        return (a * X) % Q
+
+
+@dataclass(frozen=True)
+class OrderedHOps(HOps):
+    order: int = Q
+
+
+@dataclass(frozen=True)
+class OrderedEOps(EOps):
+    order: int = Q
+
+
 def keygen(sk: int) -> int:
     # Deterministic KeyGen : H -> E (toy)
     return sk % Q
@@ -49,8 +73,9 @@ def sample_H() -> int:
     return secrets.randbelow(Q)
 
 
-def test_correctness_definition_ic_syntax():
-    params = Params(
+@pytest.fixture
+def params() -> Params[int, int]:
+    return Params(
         keygen=keygen,
         H_ops=HOps(),
         E_ops=EOps(),
@@ -59,6 +84,8 @@ def test_correctness_definition_ic_syntax():
         RO=lambda cer: ro_default(cer, lam=16),
     )
 
+
+def test_correctness_definition_ic_syntax(params):
     sk_C, pk_C = Setup(params, sample_H)
 
     identity = b"alice"
@@ -71,17 +98,41 @@ def test_correctness_definition_ic_syntax():
     assert keygen(sk_U) == pk_U
 
 
-def test_pkrecon_rejects_malformed():
-    params = Params(
-        keygen=keygen,
-        H_ops=HOps(),
-        E_ops=EOps(),
-        Encode=encode_simple,
-        Decode=decode,
-        RO=lambda cer: ro_default(cer, lam=16),
-    )
+def test_reconstruction_with_precomputed_e(params):
+    sk_C, pk_C = Setup(params, sample_H)
+    (iCer, _view_CA), (_iCer2, view_U) = iCertGen(params, b"alice", sk_C, sample_H)
+
+    e = params.RO(iCer)
+    assert SKGen(params, view_U, iCer, e=e) == SKGen(params, view_U, iCer)
+    assert PKRecon(params, iCer, pk_C, e=e) == PKRecon(params, iCer, pk_C)
+
+
+def test_icertgen_fused_keygen_matches_two_party(params):
+    sk_C, pk_C = Setup(params, sample_H)
+    k_U, k_C = sample_H(), sample_H()
+
+    plain = iCertGen(params, b"alice", sk_C, iter((k_U, k_C)).__next__)
+    fused = iCertGen(params, b"alice", sk_C, iter((k_U, k_C)).__next__, fuse_keygen=True)
+    assert fused == plain
+
+    (iCer, _view_CA), (_iCer2, view_U) = fused
+    assert keygen(SKGen(params, view_U, iCer)) == PKRecon(params, iCer, pk_C)
+
 
+def test_pkrecon_rejects_malformed(params):
     sk_C, pk_C = Setup(params, sample_H)
 
     malformed = b"not-an-icert"
     assert PKRecon(params, malformed, pk_C) is None
+
+
+def test_z_action_scalar_mul_matches_generic():
+    for a in (0, 1, 2, -3, 65536, 2**31 - 1, 2**40 + 7, -(2**70 + 1), 0xF0F0_0001_8000_FFFF_0123):
+        assert z_action_H(NativeHOps(), a, 4242) == z_action_H(HOps(), a, 4242)
+        assert z_action_E(NativeEOps(), a, 4242) == z_action_E(EOps(), a, 4242)
+
+
+def test_z_action_reduces_by_known_order():
+    for a in (0, 1, -1, Q, -Q, Q + 5, 2**40 + 7, -(2**70 + 1)):
+        assert z_action_H(OrderedHOps(), a, 4242) == z_action_H(HOps(), a, 4242)
+        assert z_action_E(OrderedEOps(), a, 4242) == z_action_E(EOps(), a, 4242)